@@ -5,6 +5,20 @@ import RCAIDE
 from RCAIDE.Framework.Core     import Data
 from RCAIDE.Framework.Analyses import Analysis  
 
+from copy import copy
+
+# ----------------------------------------------------------------------
+#  Settings Templates
+# ----------------------------------------------------------------------
+# copied into each weights analysis rather than rebuilt field by field
+FLOPS_settings = Data() 
+FLOPS_settings.aeroelastic_tailoring_factor = 0.   # Aeroelastic tailoring factor [0 no aeroelastic tailoring, 1 maximum aeroelastic tailoring] 
+FLOPS_settings.strut_braced_wing_factor     = 0.   # Wing strut bracing factor [0 for no struts, 1 for struts]
+FLOPS_settings.composite_utilization_factor = 0.5  # Composite utilization factor [0 no composite, 1 full composite]
+
+Raymer_settings = Data()
+Raymer_settings.fuselage_mounted_landing_gear_factor = 1. # 1. if false, 1.12 if true
+
 # ----------------------------------------------------------------------
 #  Analysis
 # ---------------------------------------------------------------------- 
@@ -57,15 +71,9 @@ class Weights(Analysis):
         self.settings.weight_reduction_factors.fuselage  = 0.  # Reduction factors are proportional (.1 is a 10% weight reduction)
         self.settings.weight_reduction_factors.empennage = 0.  # applied to horizontal and vertical stabilizers
         
-        # FLOPS settings
-        self.settings.FLOPS = Data() 
-        self.settings.FLOPS.aeroelastic_tailoring_factor = 0.   # Aeroelastic tailoring factor [0 no aeroelastic tailoring, 1 maximum aeroelastic tailoring] 
-        self.settings.FLOPS.strut_braced_wing_factor     = 0.   # Wing strut bracing factor [0 for no struts, 1 for struts]
-        self.settings.FLOPS.composite_utilization_factor = 0.5  # Composite utilization factor [0 no composite, 1 full composite]
-        
-        # Raymer settings
-        self.settings.Raymer = Data()
-        self.settings.Raymer.fuselage_mounted_landing_gear_factor = 1. # 1. if false, 1.12 if true
+        # FLOPS and Raymer settings
+        self.settings.FLOPS  = copy(FLOPS_settings) 
+        self.settings.Raymer = copy(Raymer_settings)
                        
         
     def evaluate(self):
@@ -8,7 +8,9 @@
 
 import RCAIDE
 from RCAIDE.Framework.Core import Data 
-from .Weights import Weights
+from .Weights import Weights, FLOPS_settings, Raymer_settings
+
+from copy import copy
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Transport Weights Analysis
@@ -64,15 +66,9 @@ class Weights_Transport(Weights):
         self.settings.weight_reduction_factors.fuselage  = 0.  # Reduction factors are proportional (.1 is a 10% weight reduction)
         self.settings.weight_reduction_factors.empennage = 0.  # applied to horizontal and vertical stabilizers
         
-        # FLOPS settings
-        self.settings.FLOPS = Data() 
-        self.settings.FLOPS.aeroelastic_tailoring_factor = 0.   # Aeroelastic tailoring factor [0 no aeroelastic tailoring, 1 maximum aeroelastic tailoring] 
-        self.settings.FLOPS.strut_braced_wing_factor     = 0.   # Wing strut bracing factor [0 for no struts, 1 for struts]
-        self.settings.FLOPS.composite_utilization_factor = 0.5  # Composite utilization factor [0 no composite, 1 full composite]
-        
-        # Raymer settings
-        self.settings.Raymer = Data()
-        self.settings.Raymer.fuselage_mounted_landing_gear_factor = 1. # 1. if false, 1.12 if true
+        # FLOPS and Raymer settings
+        self.settings.FLOPS  = copy(FLOPS_settings) 
+        self.settings.Raymer = copy(Raymer_settings)
 
     def evaluate(self):
         """Evaluate the weight analysis.
@@ -8,20 +8,34 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
+import importlib
+
 from .Analysis  import Analysis 
 from .Process   import Process
 from .Settings  import Settings
 from .Vehicle   import Vehicle 
 
-from . import Common
-from . import Aerodynamics
-from . import Atmospheric
-from . import Emissions
-from . import Energy
-from . import Noise
-from . import Planets
-from . import Propulsion
-from . import Stability
-from . import Weights
-from . import Emissions
-from . import Geodesics
\ No newline at end of file
+# analysis subpackages are imported on first attribute access (PEP 562)
+_LAZY = {'Common',
+         'Aerodynamics',
+         'Atmospheric',
+         'Emissions',
+         'Energy',
+         'Geodesics',
+         'Noise',
+         'Planets',
+         'Propulsion',
+         'Stability',
+         'Weights'}
+
+__all__ = ['Analysis', 'Process', 'Settings', 'Vehicle'] + sorted(_LAZY)
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module('.' + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
@@ -10,7 +10,12 @@ import numpy as np
 # ----------------------------------------------------------------------       
 
 array_type  = np.ndarray
-matrix_type = np.matrixlib.defmatrix.matrix
+
+# bound once so the coercion helpers skip the module attribute lookup
+_asarray    = np.asarray
+
+# reshape targets for rank 0 and rank 1 inputs
+_SHAPES = {'row': (1,-1), 'col': (-1,1)}
  
 def atleast_2d_col(A):
     """Makes a 2D array in column format
@@ -30,7 +35,8 @@ def atleast_2d_col(A):
     Properties Used:
     N/A
     """       
-    return atleast_2d(A,'col')
+    A = _asarray(A)
+    return A if A.ndim >= 2 else A.reshape(-1,1)
 
 
 def atleast_2d_row(A):
@@ -51,7 +57,8 @@ def atleast_2d_row(A):
     Properties Used:
     N/A
     """       
-    return atleast_2d(A,'row')
+    A = _asarray(A)
+    return A if A.ndim >= 2 else A.reshape(1,-1)
 
 
 def atleast_2d(A,oned_as='row'):
@@ -73,20 +80,15 @@ def atleast_2d(A,oned_as='row'):
     N/A
     """       
     
-    # not an array yet
-    if not isinstance(A,(array_type,matrix_type)):
-        if not isinstance(A,(list,tuple)):
-            A = [A]
-        A = np.array(A)
-        
+    A = _asarray(A)
+    
     # check rank
-    if A.ndim < 2:
-        # expand row or col
-        if oned_as == 'row':
-            A = A[None,:]
-        elif oned_as == 'col':
-            A = A[:,None]
-        else:
-            raise Exception("oned_as must be 'row' or 'col' ")
-            
-    return A
\ No newline at end of file
+    if A.ndim >= 2:
+        return A
+    
+    # expand row or col
+    try:
+        return A.reshape(_SHAPES[oned_as])
+    except KeyError:
+        raise ValueError("oned_as must be 'row' or 'col' ") from None
+
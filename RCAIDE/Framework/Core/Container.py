@@ -10,13 +10,51 @@
 
 from .               import Data
 from warnings        import warn
-import random
+from collections     import Counter
+
+import functools
 
 import string
 chars = string.punctuation + string.whitespace
 t_table = str.maketrans( chars          + string.ascii_uppercase , 
                             '_'*len(chars) + string.ascii_lowercase )
 
+def sanitized_tag(val):
+    # """ Returns the container key for a value's tag. The result is remembered on the value,
+    #     alongside the raw tag it came from, so repeated appends skip the translate.
+    
+    #     Assumptions:
+    #     None
+    
+    #     Source:
+    #     N/A
+    
+    #     Inputs:
+    #     val      [Data]
+    
+    #     Outputs:
+    #     tag      [str]
+        
+    #     Properties Used:
+    #     N/A
+    # """   
+    raw    = val.tag
+    
+    # lowercase identifiers have no punctuation, whitespace or capitals to translate
+    if raw.isidentifier() and raw.islower():
+        return raw
+    cached = getattr(val,'_sanitized_tag',None)
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+    tag = raw.translate(t_table).lower()
+    
+    # kept off the dict so it is not iterated as a component
+    try:
+        object.__setattr__(val,'_sanitized_tag',(raw,tag))
+    except AttributeError:
+        pass
+    return tag
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  Container
 # ----------------------------------------------------------------------------------------------------------------------   
@@ -32,7 +70,30 @@ class Container(Data):
     #     N/A
         
     # """
+    
+    _has_defaults = False
+    
+    def __init_subclass__(cls,**kwarg):
+        # """ Flags once per class whether __defaults__ is overridden, so __init__ only
+        #     dispatches to it when there is something to set.
+        
+        #     Assumptions:
+        #     None
+        
+        #     Source:
+        #     N/A
+        
+        #     Inputs:
+        #     cls
+        
+        #     Outputs:
+        #     N/A
             
+        #     Properties Used:
+        #     N/A
+        # """          
+        super(Container,cls).__init_subclass__(**kwarg)
+        cls._has_defaults = cls.__defaults__ is not Container.__defaults__
         
     def __defaults__(self):
         # """ Defaults function
@@ -73,7 +134,12 @@ class Container(Data):
         #     N/A
         # """          
         super(Container,self).__init__(*args,**kwarg)
-        self.__defaults__()
+        
+        # running count of appended tags, kept off the dict so it is not iterated as a component
+        object.__setattr__(self,'_tag_counts',Counter())
+        
+        if type(self)._has_defaults:
+            self.__defaults__()
     
     def append(self,val):
         # """ Appends the value to the containers
@@ -97,17 +163,18 @@ class Container(Data):
         # """           
         
         # See if the item tag exists, if it does modify the name
-        keys = self.keys()
-        
-        tag = str.lower(val.tag.translate(t_table))
-        if tag in keys:
-            string_of_keys = "".join(self.keys())
-            n_comps = string_of_keys.count(val.tag)
+        tag    = sanitized_tag(val)
+        counts = self._tag_counts
+        n_comps = counts[tag]
+        if tag in self:
+            n_comps = max(n_comps,1)
             val.tag = tag + str(n_comps+1)
             
-            # Check again, because theres an outside chance that its duplicate again. Then assign a random
-            if val.tag in keys:
-                val.tag = tag + str(n_comps+random.randint(0,1000))
+            # Check again, because the tag may have been added without append 
+            while val.tag in self:
+                n_comps += 1
+                val.tag  = tag + str(n_comps+1)
+        counts[tag] = n_comps + 1
         
         Data.append(self,val)
         
@@ -130,13 +197,61 @@ class Container(Data):
         #     N/A
         # """         
         if isinstance(vals,(list,tuple)):
-            for v in val: self.append(v)
+            # subclasses that file components their own way have to see every append
+            if type(self).append is not Container.append:
+                for v in vals: self.append(v)
+                return
+            
+            tags   = [sanitized_tag(v) for v in vals]
+            counts = self._tag_counts
+            
+            # unique tags that are new to this container can be inserted in one pass
+            if len(set(tags)) == len(tags) and not any((t in self) or counts[t] for t in tags):
+                dict.update(self,zip(tags,vals))
+                counts.update(tags)
+            else:
+                for v in vals: self.append(v)
         elif isinstance(vals,dict):
-            self.update(vals)
+            # without overlapping keys there is nothing to merge recursively
+            if self.keys().isdisjoint(vals.keys()):
+                dict.update(self,{k:v for k,v in vals.items() if not k.startswith('_')})
+            else:
+                self.update(vals)
         else:
             raise Exception('unrecognized data type')
+            
+    def __copy__(self):
+        # """ Shallow copy of the container. The components are shared with the 
+        #     original but the count of appended tags is not, so appending to 
+        #     either one does not change how the other names new components.
+    
+        #     Assumptions:
+        #     None
+        
+        #     Source:
+        #     N/A
+        
+        #     Inputs:
+        #     self
+        
+        #     Outputs:
+        #     new      - copy of the container
+            
+        #     Properties Used:
+        #     N/A
+        # """  
+        cls = self.__class__
+        new = cls.__new__(cls)
+        new.__dict__.update(self.__dict__)
+        for k, v in self.items():
+            new[k] = v
+        object.__setattr__(new,'_tag_counts',Counter(self._tag_counts))
+        
+        return new
         
-    def get_children(self):
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_children(cls):
         # """ Returns the components that can go inside
         
         # Assumptions:
@@ -155,4 +270,4 @@ class Container(Data):
         # N/A
         # """        
         
-        return []    
\ No newline at end of file
+        return ()    
\ No newline at end of file
@@ -13,6 +13,8 @@
 
 from .DataOrdered import DataOrdered
 
+import functools
+
 # ----------------------------------------------------------------------
 #   Data Container Base Class
 # ----------------------------------------------------------------------        
@@ -28,6 +30,30 @@ class ContainerOrdered(DataOrdered):
         N/A
         
     """
+    
+    _has_defaults = False
+    
+    def __init_subclass__(cls,**kwarg):
+        """Flags once per class whether __defaults__ is overridden, so __init__ only
+            dispatches to it when there is something to set.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            cls
+    
+            Outputs:
+            N/A
+    
+            Properties Used:
+            N/A
+            """          
+        super(ContainerOrdered,cls).__init_subclass__(**kwarg)
+        cls._has_defaults = cls.__defaults__ is not ContainerOrdered.__defaults__
         
     def __defaults__(self):
         """Defaults function
@@ -68,7 +94,8 @@ class ContainerOrdered(DataOrdered):
             N/A
             """           
         super(ContainerOrdered,self).__init__(*args,**kwarg)
-        self.__defaults__()
+        if type(self)._has_defaults:
+            self.__defaults__()
     
     def append(self,val):
         """Appends the value to the containers
@@ -91,7 +118,9 @@ class ContainerOrdered(DataOrdered):
         #val = self.check_new_val(val)
         DataOrdered.append(self,val)
         
-    def get_children(self):
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_children(cls):
         """ Returns the components that can go inside
         
         Assumptions:
@@ -110,4 +139,4 @@ class ContainerOrdered(DataOrdered):
         N/A
         """        
         
-        return []  
\ No newline at end of file
+        return ()  
\ No newline at end of file
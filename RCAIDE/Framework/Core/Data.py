@@ -13,9 +13,10 @@
 # ----------------------------------------------------------------------
 
 import numpy as np
-from .Arrays import atleast_2d_col, array_type, matrix_type 
+from .Arrays import atleast_2d_col, array_type
 
 from copy import copy
+import functools
 
 # for enforcing attribute style access names
 import string
@@ -25,7 +26,139 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
                             '_'*len(chars) + string.ascii_lowercase )
 
 dictgetitem = dict.__getitem__
+dictsetitem = dict.__setitem__
 objgetattrib = object.__getattribute__
+_dict_get    = dict.get
+
+# sentinel for key lookups that miss
+_MISSING = object()
+
+# non-array values that pack_array and unpack_array handle
+scalar_types = ( int, float )
+
+@functools.lru_cache(maxsize=4096)
+def _parse_path(keys):
+    """ Splits a dotted key path into its keys. Cached since the same paths are 
+        set and retrieved over and over in optimization loops
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        keys     - dotted key path [str]
+    
+        Outputs:
+        tuple of keys
+    
+        Properties Used:
+        N/A
+    """
+    return tuple(keys.split('.'))
+
+@functools.lru_cache(maxsize=4096)
+def _parse_indices(key):
+    """ Splits a key with trailing list indices, such as 'twists[2][0]', into its name
+        and integer indices. Cached alongside the key paths
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        key      [str]
+    
+        Outputs:
+        name     [str]
+        indices  - tuple of ints, empty if the key has no indices
+    
+        Properties Used:
+        N/A
+    """
+    if key[-1] != ']':
+        return key, ()
+    splitkey = key.split('[')
+    return splitkey[0], tuple(int(index[:-1]) for index in splitkey[1:])
+
+@functools.lru_cache(maxsize=4096)
+def _translate_key(key):
+    """ Enforces attribute style access names on a key. Cached since the same tags are 
+        appended across many vehicles and analyses
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        key      [str]
+    
+        Outputs:
+        key      [str]
+    
+        Properties Used:
+        N/A
+    """
+    return key.translate(t_table)
+
+def _walk_items(D):
+    """ Walks a tree of nested dicts depth first with an explicit stack instead of recursion. 
+        Sub-dicts are yielded before their own items, so the order matches a recursive walk
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        D        - the trunk dict
+    
+        Outputs:
+        (dict, key, value) for every item in the tree
+    
+        Properties Used:
+        N/A
+    """
+    stack = [(D,iter(D.items()))]
+    while stack:
+        parent, items = stack[-1]
+        for k,v in items:
+            yield parent, k, v
+            if isinstance(v,dict):
+                stack.append((v,iter(v.items())))
+                break
+        else:
+            stack.pop()
+
+def _type_lookup(klass,k):
+    """ Checks whether k is defined on a class or any of its ancestors
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        klass
+        k
+    
+        Outputs:
+        True if found
+    
+        Properties Used:
+        N/A
+    """
+    for base in klass.__mro__:
+        if k in base.__dict__:
+            return True
+    return False
 
 # ----------------------------------------------------------------------
 #   Data
@@ -46,7 +179,7 @@ class Data(dict):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Looks k up as a key first, if it is missing treats it as an object
     
             Source:
             N/A
@@ -60,16 +193,17 @@ class Data(dict):
             Properties Used:
             N/A
             """         
-        try:
-            return dictgetitem(self,k)
-        except:
+        v = _dict_get(self,k,_MISSING)
+        if v is _MISSING:
             return objgetattrib(self,k)
+        return v
 
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object attribute if the instance or its class already 
+            has it, otherwise it treats it as a key.
     
             Source:
             N/A
@@ -84,12 +218,34 @@ class Data(dict):
             Properties Used:
             N/A    
         """
-        try:
-            objgetattrib(self, k)
-        except:
-            self[k] = v
-        else:          
+        if k in objgetattrib(self,'__dict__') or _type_lookup(type(self),k):
             object.__setattr__(self, k, v) 
+        else:
+            self[k] = v
+    
+    def __getstate__(self):
+        """ Returns the instance state used by copy, deepcopy and pickle
+            
+            Assumptions:
+            The cached pack layout belongs to this instance and is left out, copies rebuild their own
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+    
+            Outputs:
+            state    - the instance __dict__ without the pack layout, None if that is empty
+    
+            Properties Used:
+            N/A    
+        """
+        state = objgetattrib(self,'__dict__')
+        if '_pack_layout' in state:
+            state = state.copy()
+            del state['_pack_layout']
+        return state or None
     
     def __defaults__(self):
         """ A stub for all classes that come later
@@ -132,21 +288,49 @@ class Data(dict):
         
         
         # initialize data, no inputs
-        self = super(Data,cls).__new__(cls)
-        super(Data,self).__init__() 
+        self = dict.__new__(cls)
+        dict.__init__(self) 
         
-        # get base class list
-        klasses = self.get_bases()
-                
-        # fill in defaults trunk to leaf
-        for klass in klasses[::-1]:
+        # defaults chain trunk to leaf, built once per class
+        chain = cls.__dict__.get('_defaults_chain')
+        if chain is None:
+            chain = cls._build_defaults_chain(self)
+        
+        # fill in defaults trunk to leaf, a few __defaults__ still fail part way
+        # through and rely on keeping what they set before the error
+        for fn in chain:
             try:
-                klass.__defaults__(self)
-            except:
+                fn(self)
+            except Exception:
                 pass
             
         return self
     
+    @classmethod
+    def _build_defaults_chain(cls,self):
+        """ Collects the __defaults__ defined by each class in the ancestor tree, trunk to leaf,
+            and stores them on the class so later instances skip the MRO walk
+    
+            Assumptions:
+            Only classes that define __defaults__ themselves contribute to the chain
+    
+            Source:
+            N/A
+    
+            Inputs:
+            self     - an instance of cls, used to find the base classes
+    
+            Outputs:
+            chain    - list of __defaults__ functions
+    
+            Properties Used:
+            N/A    
+        """
+        klasses = cls.get_bases(self)
+        chain   = [klass.__dict__['__defaults__'] for klass in klasses[::-1] if '__defaults__' in klass.__dict__]
+        cls._defaults_chain = chain
+        return chain
+    
     def typestring(self):
         """ This function makes the .key.key structure in string form of Data()
     
@@ -166,12 +350,16 @@ class Data(dict):
             N/A    
         """         
         
-        # build typestring
-        typestring = str(type(self)).split("'")[1]
-        typestring = typestring.split('.')
-        if typestring[-1] == typestring[-2]:
-            del typestring[-1]
-        typestring = '.'.join(typestring) 
+        # the typestring only depends on the class, build it once
+        klass      = type(self)
+        typestring = klass.__dict__.get('_typestring')
+        if typestring is None:
+            typestring = str(klass).split("'")[1]
+            typestring = typestring.split('.')
+            if typestring[-1] == typestring[-2]:
+                del typestring[-1]
+            typestring = '.'.join(typestring) 
+            klass._typestring = typestring
         return typestring    
     
     def dataname(self):
@@ -192,7 +380,12 @@ class Data(dict):
             Properties Used:
             N/A    
         """          
-        return "<data object '" + self.typestring() + "'>"     
+        klass    = type(self)
+        dataname = klass.__dict__.get('_dataname')
+        if dataname is None:
+            dataname = "<data object '" + self.typestring() + "'>"
+            klass._dataname = dataname
+        return dataname     
     
     
     def __str__(self,indent=''):
@@ -248,38 +441,51 @@ class Data(dict):
         """     
         
         new_indent = '  '
-        args = ''
+        parts = []
         
         # trunk data name
-        if indent: args += '\n'
+        if indent: parts.append('\n')
         
-        # print values   
-        for key,value in self.items():
-            
-            # skip 'hidden' items
-            if isinstance(key,str) and key.startswith('_'):
-                continue
-            
-            # recurse into other dict types
-            if isinstance(value,dict):
-                if not value:
-                    val = '\n'
-                else:
-                    try:
-                        val = value.__str2(indent+new_indent)
-                    except RuntimeError: # recursion limit
-                        val = ''
-                    except:
-                        val = value.__str__(indent+new_indent)
+        # walk the tree with an explicit stack, guarding against cycles
+        path  = {id(self)}
+        stack = [(indent,iter(self.items()),self)]
+        while stack:
+            ind, items, owner = stack[-1]
+            for key,value in items:
+                
+                # skip 'hidden' items
+                if type(key) is str and key[:1] == '_':
+                    continue
+                
+                # this key, indented
+                parts.append(ind + str(key) + ' : ')
+                
+                # descend into other data
+                if isinstance(value,Data):
+                    parts.append('\n')
+                    if value and id(value) not in path:
+                        path.add(id(value))
+                        stack.append((ind+new_indent,iter(value.items()),value))
+                        break
+                
+                # other dict types
+                elif isinstance(value,dict):
+                    if not value:
+                        parts.append('\n')
+                    else:
+                        try:
+                            parts.append(value.__str__(ind+new_indent))
+                        except TypeError:
+                            parts.append(str(value) + '\n')
                                                 
-            # everything else
+                # everything else
+                else:
+                    parts.append(str(value) + '\n')
             else:
-                val = str(value) + '\n'
-                
-            # this key-value, indented
-            args+= indent + str(key) + ' : ' + val
+                stack.pop()
+                path.discard(id(owner))
             
-        return args        
+        return ''.join(parts)
     
     def __init__(self,*args,**kwarg):
         """ :meta private:"""
@@ -302,11 +508,15 @@ class Data(dict):
         #     N/A    
         # """           
 
+        # nothing to merge in the common case of an empty constructor
+        if not (args or kwarg):
+            return
+        
         # handle input data (ala class factory)
         input_data = Data.__base__(*args,**kwarg)
         
         # update this data with inputs
-        self.update(input_data)    
+        type(self).update(self,input_data)    
 
     def __iter__(self):
         """ :meta private:"""
@@ -327,7 +537,8 @@ class Data(dict):
         #     Properties Used:
         #     N/A    
         # """           
-        return iter(self.values())
+        # iterate over a snapshot, loops may add items to the data they are walking
+        return iter(list(dict.values(self)))
        
     
     def values(self):
@@ -349,28 +560,7 @@ class Data(dict):
         #     Properties Used:
         #     N/A    
         # """          
-        return self.__values()          
-            
-    def __values(self):
-        """ :meta private:"""
-        #  Iterates over all keys to find all the data values.
-    
-        #     Assumptions:
-        #     N/A
-    
-        #     Source:
-        #     N/A
-    
-        #     Inputs:
-        #     N/A
-    
-        #     Outputs:
-        #     values
-    
-        #     Properties Used:
-        #     N/A    
-        #            
-        return [self[key] for key in super(Data,self).__iter__()]    
+        return dict.values(self)
     
     def update(self,other):
         """ :meta private:"""
@@ -393,15 +583,17 @@ class Data(dict):
         # """           
         if not isinstance(other,dict):
             raise TypeError('input is not a dictionary type')
+        setitem = dictsetitem
         for k,v in other.items():
-            # recurse only if self's value is a Dict()
-            if k.startswith('_'):
+            if k[:1] == '_':
                 continue
-        
-            try:
-                self[k].update(v)
-            except:
-                self[k] = v
+            
+            # recurse only if both values are dicts, otherwise overwrite
+            cur = _dict_get(self,k,_MISSING)
+            if isinstance(cur,dict) and isinstance(v,dict):
+                cur.update(v)
+            else:
+                setitem(self,k,v)
         return 
     
     def get_bases(self):
@@ -454,7 +646,7 @@ class Data(dict):
             N/A    
         """          
         if key is None: key = value.tag
-        key = key.translate(t_table)
+        key = _translate_key(key)
         if key in self: raise KeyError('key "%s" already exists' % key)
         self[key] = value        
     
@@ -479,24 +671,21 @@ class Data(dict):
         """               
         
         if isinstance(keys,str):
-            keys = keys.split('.')
+            keys = _parse_path(keys)
         
         data = self
          
-        if len(keys) > 1:
-            for k in keys[:-1]:
-                data = data[k]
-        
-        if keys[-1][-1] ==']':
-            splitkey = keys[-1].split('[')
-            thing = data[splitkey[0]]
-            for ii in range(1,len(splitkey)-1):
-                index    = int(splitkey[ii][:-1])
+        for k in keys[:-1]:
+            data = data[k]
+        
+        name, indices = _parse_indices(keys[-1])
+        if indices:
+            thing = data[name]
+            for index in indices[:-1]:
                 thing = thing[index]
-            index    = int(splitkey[-1][:-1])
-            thing[index] = val
+            thing[indices[-1]] = val
         else:
-            data[ keys[-1] ] = val
+            data[ name ] = val
             
         return data
 
@@ -520,17 +709,152 @@ class Data(dict):
         """          
         
         if isinstance(keys,str):
-            keys = keys.split('.')
+            keys = _parse_path(keys)
         
         data = self
          
-        if len(keys) > 1:
-            for k in keys[:-1]:
-                data = data[k]
+        for k in keys[:-1]:
+            data = data[k]
         
         value = data[ keys[-1] ]
         
         return value
+    
+    def do_recursive(self,method,other=None,default=None):
+        """ Recursively applies a method to the values of the class, optionally paired with 
+            the matching values of another Data of the same structure
+    
+            Assumptions:
+                values missing from other are copied over as they are
+                results of None are not stored
+    
+            Source:
+            N/A
+    
+            Inputs:
+                method  - function called as method(a) or method(a,b)
+                other   - Data of the same structure, or one value used for every leaf
+                default - N/A
+            
+            Outputs:
+                result  - a new instance of this class holding the results
+    
+            Properties Used:
+            N/A  
+        """
+        klass  = self.__class__
+        result = klass()
+        
+        # the update function
+        def do_operation(A,B,C,method=method,klass=klass):
+            for k,a in A.items():
+                if isinstance(B,Data):
+                    b = _dict_get(B,k,_MISSING)
+                    if b is _MISSING:
+                        C[k] = a
+                        continue
+                else:
+                    b = B
+                    
+                # recursion
+                if isinstance(a,Data):
+                    c = klass()
+                    C[k] = c
+                    do_operation(a,b,c)
+                    
+                # method
+                else:
+                    if b is None:
+                        c = method(a)
+                    else:
+                        c = method(a,b)
+                    if c is not None:
+                        C[k] = c
+        
+        # do the update!
+        do_operation(self,other,result)
+        
+        return result
+    
+    def _vector_layout(self):
+        """ Returns where each value of the data dict sits in the packed 1D vector. The layout is kept
+            on the instance and reused while the tree still has the same keys, sub-data, and value
+            classes, shapes and dtypes, otherwise it is rebuilt
+        
+            Assumptions:
+                same packing rules as pack_array with output = 'vector'
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+            
+            Outputs:
+                layout - (owner id, dicts and their keys, checked values, packed values, size, dtype) 
+                         packed values are (dict, key, start, stop, shape, class, dtype)
+    
+            Properties Used:
+            N/A  
+        """
+        layout = objgetattrib(self,'__dict__').get('_pack_layout')
+        if layout is not None and layout[0] == id(self):
+            _, nodes, checks, entries, _, _ = layout
+            valid = True
+            for D,keys in nodes:
+                if tuple(D.keys()) != keys:
+                    valid = False
+                    break
+            if valid:
+                for D,k,ref in checks:
+                    if D[k] is not ref:
+                        valid = False
+                        break
+            if valid:
+                for D,k,start,stop,shape,cls,dt in entries:
+                    v = D[k]
+                    if v.__class__ is not cls or (dt is not None and (v.shape != shape or v.dtype != dt)):
+                        valid = False
+                        break
+            if valid:
+                return layout
+        
+        nodes   = [(self,tuple(self.keys()))]
+        checks  = []
+        entries = []
+        dtypes  = []
+        index   = 0
+        
+        # walk the tree in the same order as pack_array
+        for D,k,v in _walk_items(self):
+            # sub data and skipped values must stay the same objects
+            if isinstance( v, dict ): 
+                checks.append((D,k,v))
+                nodes.append((v,tuple(v.keys())))
+                continue
+            elif isinstance( v, array_type ):
+                rank = v.ndim
+            elif isinstance( v, scalar_types ):
+                rank = 0
+            else:
+                checks.append((D,k,v))
+                continue
+            if rank > 2: 
+                checks.append((D,k,v))
+                continue
+            
+            shape = v.shape if rank else ()
+            dt    = v.dtype if isinstance(v,array_type) else None
+            stop  = index + (int(np.prod(shape)) if rank else 1)
+            entries.append((D,k,index,stop,shape,v.__class__,dt))
+            dtypes.append(np.asarray(v).dtype)
+            index = stop
+        
+        dtype  = np.result_type(*dtypes) if dtypes else np.float64
+        layout = (id(self),nodes,checks,entries,index,dtype)
+        object.__setattr__(self,'_pack_layout',layout)
+        
+        return layout
         
     def pack_array(self,output='vector'):
         """ maps the data dict to a 1D vector or 2D column array
@@ -561,59 +885,54 @@ class Data(dict):
         if not output in ('vector','array'): raise Exception('output type must be "vector" or "array"')        
         vector = output == 'vector'
         
+        # vectors are written straight into one buffer using the cached layout
+        if vector:
+            _, _, _, entries, size, dtype = self._vector_layout()
+            M = np.empty(size,dtype=dtype)
+            for D,k,start,stop,shape,_,_ in entries:
+                if not shape:
+                    M[start] = D[k]
+                elif len(shape) == 1:
+                    M[start:stop] = D[k]
+                else:
+                    M[start:stop].reshape(shape,order='F')[:,:] = D[k]
+            return M
+        
         # list to pre-dump array elements
         M = []
         
-        # valid types for output
-        valid_types = ( int, float,
-                        array_type,
-                        matrix_type )
-        
-        # initialize array row size (for array output)
-        size = [False]
-        
-        # the packing function
-        def do_pack(D):
-            for v in D.values(): 
-                try:
-                    rank = v.ndim
-                except:
-                    rank = 0
-                    
-                # type checking
-                if isinstance( v, dict ): 
-                    do_pack(v) # recursion!
-                    continue
-                elif not isinstance( v, valid_types ): continue
-                elif rank > 2: continue
-                # make column vectors
-                v = atleast_2d_col(v)
-                # handle output type
-                if vector:
-                    # unravel into 1d vector
-                    v = v.ravel(order='F')
-                else:
-                    # check array size
-                    size[0] = size[0] or v.shape[0] # updates size once on first array
-                    if v.shape[0] != size[0]: 
-                        #warn ('array size mismatch, skipping. all values in data must have same number of rows for array packing',RuntimeWarning)
-                        continue
-                # dump to list
-                M.append(v)
-            #: for each value
+        # initialize array row size
+        size = False
         
-        # do the packing
-        do_pack(self)
+        # do the packing, arrays only from here on
+        for _,_,v in _walk_items(self):
+            # type checking
+            if isinstance( v, array_type ):
+                if v.ndim > 2: continue
+            elif not isinstance( v, scalar_types ): continue
+            # make column vectors
+            v = atleast_2d_col(v)
+            # check array size
+            size = size or v.shape[0] # updates size once on first array
+            if v.shape[0] != size: 
+                #warn ('array size mismatch, skipping. all values in data must have same number of rows for array packing',RuntimeWarning)
+                continue
+            # dump to list
+            M.append(v)
+        #: for each value
         
-        # pack into final array
+        # pack into final array, column blocks written into one allocation
         if M:
-            M = np.hstack(M)
+            out   = np.empty((size,sum(v.shape[1] for v in M)),dtype=np.result_type(*M))
+            index = 0
+            for v in M:
+                n = v.shape[1]
+                out[:,index:(index+n)] = v
+                index += n
+            M = out
         else:
             # empty result
-            if vector:
-                M = np.array([])
-            else:
-                M = np.array([[]])
+            M = np.array([[]])
         
         # done!
         return M
@@ -638,83 +957,73 @@ class Data(dict):
             Properties Used:
             N/A    
         """           
-
-        
-        # dont require dict to have numpy
-        import numpy as np
-        from .Arrays import atleast_2d_col, array_type, matrix_type
         
         # check input type
         vector = M.ndim  == 1
         
-        # valid types for output
-        valid_types = ( int, float,
-                        array_type,
-                        matrix_type )
-        
-        # counter for unpacking
-        _index = [0]
-        
-        # the unpacking function
-        def do_unpack(D):
-            for k,v in D.items():
-                try:
-                    rank = v.ndim
-                except:
-                    rank = 0
-                # type checking
-                if isinstance(v, dict): 
-                    do_unpack(v) # recursion!
-                    continue
-                elif not isinstance(v,valid_types): continue
-                
-                # get unpack index
-                index = _index[0]                
-                
-                # skip if too big
-                if rank > 2: 
+        # vectors of the right size are read straight from the cached layout
+        if vector:
+            _, _, _, entries, size, _ = self._vector_layout()
+            if M.shape[0] == size:
+                for D,k,start,stop,shape,_,_ in entries:
+                    if not shape:
+                        D[k] = M[start]
+                    elif len(shape) == 1:
+                        D[k][:] = M[start:stop]
+                    else:
+                        D[k][:,:] = np.reshape( M[start:stop] ,shape, order='F')
+                return self
+        
+        # do the unpack
+        index = 0
+        for D,k,v in _walk_items(self):
+            # type checking
+            if isinstance(v, array_type): 
+                rank = v.ndim
+            elif isinstance(v, scalar_types): 
+                rank = 0
+            else:
+                continue
+            
+            # skip if too big
+            if rank > 2: 
+                continue
+            
+            # scalars
+            elif rank == 0:
+                if vector:
+                    D[k] = M[index]
+                    index += 1
+                else:#array
                     continue
+                    #raise RuntimeError , 'array size mismatch, all values in data must have same number of rows for array unpacking'
                 
-                # scalars
-                elif rank == 0:
-                    if vector:
-                        D[k] = M[index]
-                        index += 1
-                    else:#array
-                        continue
-                        #raise RuntimeError , 'array size mismatch, all values in data must have same number of rows for array unpacking'
-                    
-                # 1d vectors
-                elif rank == 1:
-                    n = len(v)
-                    if vector:
-                        D[k][:] = M[index:(index+n)]
-                        index += n
-                    else:#array
-                        D[k][:] = M[:,index]
-                        index += 1
-                    
-                # 2d arrays
-                elif rank == 2:
-                    n,m = v.shape
-                    if vector:
-                        D[k][:,:] = np.reshape( M[index:(index+(n*m))] ,[n,m], order='F')
-                        index += n*m 
-                    else:#array
-                        D[k][:,:] = M[:,index:(index+m)]
-                        index += m
-                
-                #: switch rank
+            # 1d vectors
+            elif rank == 1:
+                n = len(v)
+                if vector:
+                    D[k][:] = M[index:(index+n)]
+                    index += n
+                else:#array
+                    D[k][:] = M[:,index]
+                    index += 1
                 
-                _index[0] = index
+            # 2d arrays
+            elif rank == 2:
+                n,m = v.shape
+                if vector:
+                    D[k][:,:] = np.reshape( M[index:(index+(n*m))] ,[n,m], order='F')
+                    index += n*m 
+                else:#array
+                    D[k][:,:] = M[:,index:(index+m)]
+                    index += m
+            
+            #: switch rank
 
-            #: for each itme
-        
-        # do the unpack
-        do_unpack(self)
+        #: for each itme
          
         # check
-        if not M.shape[-1] == _index[0]: warn('did not unpack all values',RuntimeWarning)
+        if not M.shape[-1] == index: warn('did not unpack all values',RuntimeWarning)
          
         # done!
         return self      
\ No newline at end of file
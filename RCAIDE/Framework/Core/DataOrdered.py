@@ -11,7 +11,10 @@
 #   Imports
 # ----------------------------------------------------------------------  
 
-from collections import OrderedDict
+from reprlib import recursive_repr
+from itertools import islice
+import functools
+import sys
 
 # for enforcing attribute style access names
 import string
@@ -21,122 +24,47 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
 
 import numpy as np
 
-# ----------------------------------------------------------------------
-#   Property Class
-# ----------------------------------------------------------------------   
+# sentinel for keys that are not in the dict
+_MISSING = object()
 
-class Property(object):
-    """ Used to create the root map essential to the linking in DataOrdered()
-       
+@functools.lru_cache(maxsize=4096)
+def _translate_key(key):
+    """ Enforces attribute style access names on a key. Cached since the same tags are 
+        appended across many configurations, and interned so later attribute lookups by 
+        the same name match the stored key by identity
+    
         Assumptions:
         N/A
-        
+    
         Source:
         N/A
-    """    
-    
-    def __init__(self,key=None):
-        """ Initializes a property
-    
-            Assumptions:
-            N/A
-    
-            Source:
-            N/A
-    
-            Inputs:
-            N/A
-    
-            Outputs:
-            N/A
-    
-            Properties Used:
-            N/A    
-        """           
-        self._key = key
-        
-    def __get__(self,obj,kls=None):
-        """ Gets a property
-    
-            Assumptions:
-            N/A
-    
-            Source:
-            N/A
-    
-            Inputs:
-            obj
-    
-            Outputs:
-            self.key
-    
-            Properties Used:
-            N/A    
-        """           
-        if obj is None: return self
-        else          : return dict.__getitem__(obj,self._key)
-        
-    def __set__(self,obj,val):
-        """ Sets a property
-    
-            Assumptions:
-            N/A
-    
-            Source:
-            N/A
-    
-            Inputs:
-            obj
-            value
-    
-            Outputs:
-            N/A
-    
-            Properties Used:
-            N/A    
-        """          
-        dict.__setitem__(obj,self._key,val)
-        
-    def __delete__(self,obj):
-        """ Deletes a property
     
-            Assumptions:
-            N/A
-    
-            Source:
-            N/A
-    
-            Inputs:
-            N/A
+        Inputs:
+        key      [str]
     
-            Outputs:
-            N/A
+        Outputs:
+        key      [str]
     
-            Properties Used:
-            N/A    
-        """          
-        dict.__delitem__(obj,self._key)
+        Properties Used:
+        N/A
+    """
+    return sys.intern(key.translate(t_table))
 
-    
 # ----------------------------------------------------------------------
 #   DataOrdered
 # ----------------------------------------------------------------------        
 
-class DataOrdered(OrderedDict):
+class DataOrdered(dict):
     """ An extension of the Python dict which allows for both tag and '.' usage.
         This is an ordered dictionary. So indexing it will produce deterministic results.
        
         Assumptions:
-        N/A
+        Relies on the insertion order of the builtin dict
         
         Source:
         N/A
     """
     
-    
-    _root = Property('_root')
-    _map  = Property('_map')    
-    
     def append(self,value,key=None):
         """ Adds new values to the classes. Can also change an already appended key
     
@@ -157,9 +85,9 @@ class DataOrdered(OrderedDict):
             N/A    
         """         
         if key is None: key = value.tag
-        key = key.translate(t_table)
+        key = _translate_key(key)
         if key is None: key = value.tag
-        if key in self: raise KeyError('key "%s" already exists' % key)
+        # an existing key keeps its place and takes the new value
         self.__setattr__(key,value)    
 
     def __defaults__(self):
@@ -200,10 +128,45 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """          
-        if not (isinstance(k,int) or isinstance(k,np.int64)):
-            return super(DataOrdered,self).__getattribute__(k)
+        if type(k) is str:
+            v = dict.get(self,k,_MISSING)
+            if v is _MISSING:
+                return object.__getattribute__(self,k)
+            return v
+        elif isinstance(k,(int,np.integer)):
+            # walk to the k-th key instead of building the whole key list
+            if k < 0:
+                k += dict.__len__(self)
+            if k < 0:
+                raise IndexError('list index out of range')
+            for key in islice(dict.__iter__(self),k,None):
+                return dict.__getitem__(self,key)
+            raise IndexError('list index out of range')
         else:
-            return super(DataOrdered,self).__getattribute__(self.keys()[k])
+            return DataOrdered.__getattribute__(self,k)
+    
+    def __getattribute__(self, k):
+        """ Retrieves an attribute set by a key k
+    
+            Assumptions:
+            Looks k up as a key first, if it is missing treats it as an object
+    
+            Source:
+            N/A
+    
+            Inputs:
+            k
+    
+            Outputs:
+            whatever is found by k
+    
+            Properties Used:
+            N/A
+            """         
+        v = dict.get(self,k,_MISSING)
+        if v is _MISSING:
+            return object.__getattribute__(self,k)
+        return v
     
     def __new__(cls,*args,**kwarg):
         """ Creates a new Data() class
@@ -224,34 +187,63 @@ class DataOrdered(OrderedDict):
             N/A    
         """         
         # Make the new:
-        self = OrderedDict.__new__(cls)
-        
-        if self.hasattr('_root'):
-            self._root
-        else:
-            root = [] # sentinel node
-            root[:] = [root, root, None]
-            dict.__setitem__(self,'_root',root)
-            dict.__setitem__(self,'_map' ,{})        
+        self = dict.__new__(cls)
         
         # Use the base init
         self.__init2()
         
-        # get base class list
-        klasses = self.get_bases()
-                
         # fill in defaults trunk to leaf
-        for klass in klasses[::-1]:
-            klass.__defaults__(self)
+        for fn in cls._get_defaults_chain():
+            fn(self)
             
         return self
     
+    @classmethod
+    def _get_defaults_chain(cls):
+        """ Returns the __defaults__ defined by each class in the ancestor tree, trunk to leaf.
+            The list is built on first use and stored on the class
+    
+            Assumptions:
+            Only classes that define __defaults__ themselves contribute to the chain
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+    
+            Outputs:
+            chain    - list of __defaults__ functions
+    
+            Properties Used:
+            N/A    
+        """
+        chain = cls.__dict__.get('_defaults_chain')
+        if chain is None:
+            # the ancestor tree without dict and object, trunk first
+            chain = [klass.__dict__['__defaults__'] for klass in cls.__mro__[-3::-1] if '__defaults__' in klass.__dict__]
+            cls._defaults_chain = chain
+        return chain
+    
     def hasattr(self,k):
-        try:
-            self.__getitem__(k)
-            return True
-        except:
-            return False
+        """ Checks if k is a key or an attribute
+    
+            Assumptions:
+            Keys are checked first with a single hash lookup
+    
+            Source:
+            N/A
+    
+            Inputs:
+            k
+    
+            Outputs:
+            True or False
+    
+            Properties Used:
+            N/A    
+        """         
+        return dict.__contains__(self,k) or hasattr(self,k)
             
     
     def __init__(self,*args,**kwarg):
@@ -345,7 +337,7 @@ class DataOrdered(OrderedDict):
         """ Finds the higher classes that may be built off of data
     
             Assumptions:
-            N/A
+            The list is computed once per class and shared, callers should not modify it
     
             Source:
             N/A
@@ -359,15 +351,21 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """        
+        klass   = self.__class__
+        klasses = klass.__dict__.get('_bases_cache')
+        if klasses is not None:
+            return klasses
+        
         # Get the Method Resolution Order, i.e. the ancestor tree
-        klasses = list(self.__class__.__mro__)
+        klasses = list(klass.__mro__)
         
         # Make sure that this is a Data object, otherwise throw an error.
         if DataOrdered not in klasses:
-            raise TypeError('class %s is not of type Data()' % self.__class__)    
+            raise TypeError('class %s is not of type Data()' % klass)    
         
         # Remove the last two items, dict and object. Since the line before ensures this is a data object this won't break
-        klasses = klasses[:-3]
+        klasses = klasses[:-2]
+        klass._bases_cache = klasses
 
         return klasses 
     
@@ -389,11 +387,16 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """           
-        typestring = str(type(self)).split("'")[1]
-        typestring = typestring.split('.')
-        if typestring[-1] == typestring[-2]:
-            del typestring[-1]
-        typestring = '.'.join(typestring) 
+        # the typestring only depends on the class, build it once
+        klass      = type(self)
+        typestring = klass.__dict__.get('_typestring')
+        if typestring is None:
+            typestring = str(klass).split("'")[1]
+            typestring = typestring.split('.')
+            if typestring[-1] == typestring[-2]:
+                del typestring[-1]
+            typestring = '.'.join(typestring) 
+            klass._typestring = typestring
         return typestring
     
     def dataname(self):
@@ -414,7 +417,12 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """        
-        return "<data object '" + self.typestring() + "'>"
+        klass    = type(self)
+        dataname = klass.__dict__.get('_dataname')
+        if dataname is None:
+            dataname = "<data object '" + self.typestring() + "'>"
+            klass._dataname = dataname
+        return dataname
 
     def deep_set(self,keys,val):
         """ Regresses through a list of keys the same value in various places in a dictionary.
@@ -502,13 +510,14 @@ class DataOrdered(OrderedDict):
         if not isinstance(other,dict):
             raise TypeError('input is not a dictionary type')
         for k,v in other.items():
-            # recurse only if self's value is a Dict()
-            if k.startswith('_'):
+            if k[:1] == '_':
                 continue
-        
-            try:
-                self[k].update(v)
-            except:
+            
+            # recurse only if both values are dicts, otherwise overwrite
+            cur = dict.get(self,k,_MISSING)
+            if isinstance(cur,dict) and isinstance(v,dict):
+                cur.update(v)
+            else:
                 self[k] = v
         return 
 
@@ -530,12 +539,10 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """            
-        # Deleting an existing item uses self._map to find the link which is
-        # then removed by updating the links in the predecessor and successor nodes.
-        OrderedDict.__delattr__(self,key)
-        link_prev, link_next, key = self._map.pop(key)
-        link_prev[1] = link_next
-        link_next[0] = link_prev 
+        if dict.__contains__(self,key):
+            dict.__delitem__(self,key)
+        else:
+            object.__delattr__(self,key)
         
     def __len__(self):
         """ This is overrides the Python function for checking length
@@ -555,10 +562,11 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """          
-        return self.__dict__.__len__()   
-
-    def __iter_basic__(self):
-        """ Returns all the iterable values. Can be used in a for loop.
+        return dict.__len__(self)
+    
+    @recursive_repr()
+    def __repr__(self):
+        """ Prints the class name and items in the same form as an OrderedDict
     
             Assumptions:
             N/A
@@ -574,12 +582,8 @@ class DataOrdered(OrderedDict):
     
             Properties Used:
             N/A    
-        """           
-        root = self._root
-        curr = root[1]
-        while curr is not root:
-            yield curr[2]
-            curr = curr[1]
+        """          
+        return '%s(%r)' % (self.__class__.__name__, self.items())
             
     def __reduce__(self):
         """ Reduction function used for making configs
@@ -599,9 +603,9 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """          
-        items = [( k, DataOrdered.__getitem2(self,k) ) for k in DataOrdered.iterkeys(self)]
+        items = list(dict.items(self))
         inst_dict = vars(self).copy()
-        for k in vars(DataOrdered()):
+        for k in _reduce_strip_keys:
             inst_dict.pop(k, None)
         return (_reconstructor, (self.__class__,items,), inst_dict)
     
@@ -624,15 +628,11 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """        
-        # Setting a new item creates a new link which goes at the end of the linked
-        # list, and the inherited dictionary is updated with the new key/value pair.
-        if not hasattr(self,key) and not hasattr(self.__class__,key):
-        #if not self.has_key(key) and not hasattr(self.__class__,key):
-            root = dict.__getitem__(self,'_root')
-            last = root[0]
-            map  = dict.__getitem__(self,'_map')
-            last[1] = root[0] = map[key] = [last, root, key]
-        OrderedDict.__setattr__(self,key, value)
+        # New keys go to the end of the dict, names the class or instance already has stay attributes
+        if not dict.__contains__(self,key) and (key in object.__getattribute__(self,'__dict__') or hasattr(self.__class__,key)):
+            object.__setattr__(self,key,value)
+        else:
+            dict.__setitem__(self,key,value)
 
     def __setitem__(self,k,v):
         """ An override of the standard __setattr_ in Python.
@@ -653,7 +653,11 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """        
-        self.__setattr__(k,v)
+        # same rule as __setattr__, inlined to save a call per item
+        if not dict.__contains__(self,k) and (k in object.__getattribute__(self,'__dict__') or hasattr(self.__class__,k)):
+            object.__setattr__(self,k,v)
+        else:
+            dict.__setitem__(self,k,v)
          
 
     def clear(self):
@@ -675,14 +679,7 @@ class DataOrdered(OrderedDict):
             N/A    
         """        
         
-        try:
-            for node in self._map.values():
-                del node[:]
-            root = self._root
-            root[:] = [root, root, None]
-            self._map.clear()
-        except AttributeError:
-            pass
+        dict.clear(self)
         self.__dict__.clear()
         
     def get(self,k,d=None):
@@ -703,7 +700,7 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """         
-        return self.__dict__.get(k,d)
+        return dict.get(self,k,d)
         
     def has_key(self,k):
         """ Checks if the dictionary has the key, k
@@ -723,11 +720,10 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """             
-        return k in self.__dict__
+        return dict.__contains__(self,k)
 
     # allow override of iterators
     __iter = __iter__
-    __getitem2 = OrderedDict.__getattribute__ 
 
     def keys(self):
         """ Returns a list of keys
@@ -747,7 +743,7 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """         
-        return list(self.__iter_basic__())
+        return list(dict.keys(self))
     
     def values(self):
         """ Returns all values inside the Data() class.
@@ -767,7 +763,7 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """             
-        return [self[key] for key in self.__iter_basic__()]
+        return list(dict.values(self))
     
     def items(self):
         """ Returns all the items inside the data class
@@ -787,7 +783,7 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """          
-        return [(key, self[key]) for key in self.__iter_basic__()]
+        return list(dict.items(self))
     
     def iterkeys(self):
         """ Returns all the keys which may be iterated over
@@ -807,7 +803,10 @@ class DataOrdered(OrderedDict):
             Properties Used:
             N/A    
         """         
-        return self.__iter_basic__() 
+        return iter(dict.keys(self))
+
+# attributes every new DataOrdered has, which are left out when reducing
+_reduce_strip_keys = frozenset(vars(DataOrdered()))
 
 # for rebuilding dictionaries with attributes
 def _reconstructor(klass,items):
@@ -830,4 +829,4 @@ def _reconstructor(klass,items):
     """        
     self = DataOrdered.__new__(klass)
     DataOrdered.__init__(self,items)
-    return self
\ No newline at end of file
+    return self
\ No newline at end of file
@@ -72,7 +72,7 @@ class Diffed_Data(Data):
         """  
         if base is None: base = Data()
         self._base = base
-        this = deepcopy(base) # deepcopy is needed here to build configs - Feb 2016, T. MacDonald
+        this = _fast_clone(base) # a deep copy is needed here to build configs - Feb 2016, T. MacDonald
         Data.__init__(self,this)
         
     def store_diff(self):
@@ -162,10 +162,104 @@ class Container(ContainerBase):
 
 Diffed_Data.Container = Container
 
+# ------------------------------------------------------------
+#  Cloning Function
+# ------------------------------------------------------------
+
+# values that are shared rather than copied
+_atomic_types = (int, float, complex, str, bool, type(None))
+
+def _plain_copy(t,base):
+    """ Checks that a class copies the same way as base, so none of its ancestors between it and
+        base change how it is reduced, pickled or deep copied
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        t       - class of the object being copied
+        base    - Data or DataOrdered
+
+        Outputs:
+        True if the fast clone gives the same result as deepcopy
+
+        Properties Used:
+        N/A    
+    """  
+    return (t.__reduce__ is base.__reduce__ and t.__reduce_ex__ is base.__reduce_ex__ 
+            and getattr(t,'__getstate__',None) is getattr(base,'__getstate__',None)
+            and getattr(t,'__deepcopy__',None) is getattr(base,'__deepcopy__',None))
+
+def _fast_clone(obj,memo=None):
+    """ Makes a deep copy of a tree of Data and DataOrdered. The tree is rebuilt directly instead of 
+        through deepcopy's generic reduce machinery, anything else is handed to deepcopy
+
+        Assumptions:
+        Gives the same result as deepcopy, including shared references and cycles
+
+        Source:
+        N/A
+
+        Inputs:
+        obj
+        memo    - objects already copied, keyed by id
+
+        Outputs:
+        copy of obj
+
+        Properties Used:
+        N/A    
+    """  
+    t = type(obj)
+    if t in _atomic_types:
+        return obj
+    
+    if memo is None:
+        memo = {}
+    else:
+        new = memo.get(id(obj))
+        if new is not None:
+            return new
+    
+    # numerical arrays, keeping the memory layout
+    if t is np.ndarray and not obj.dtype.hasobject:
+        new = obj.copy(order='K')
+        memo[id(obj)] = new
+        return new
+    
+    # data trees, built the same way deepcopy would but without the reduce round trip
+    if isinstance(obj,Data) and _plain_copy(t,Data):
+        new = t.__new__(t)
+        memo[id(obj)] = new
+        state = obj.__getstate__()
+        if state:
+            object.__getattribute__(new,'__dict__').update(deepcopy(state,memo))
+        for k,v in dict.items(obj):
+            dict.__setitem__(new,k,_fast_clone(v,memo))
+        return new
+    
+    if isinstance(obj,DataOrdered) and _plain_copy(t,DataOrdered):
+        new = t.__new__(t)
+        memo[id(obj)] = new
+        DataOrdered.__init__(new,[(k,_fast_clone(v,memo)) for k,v in dict.items(obj)])
+        state = object.__getattribute__(obj,'__dict__')
+        if state:
+            object.__getattribute__(new,'__dict__').update(deepcopy(state,memo))
+        return new
+    
+    # everything else
+    return deepcopy(obj,memo)
+
 # ------------------------------------------------------------
 #  Diffing Function
 # ------------------------------------------------------------
 
+# bookkeeping keys of Diffed_Data that are never diffed
+_diffed_keys = frozenset(('_base','_diff'))
+
 def diff(A,B):
     """ The magic diff function that makes Diffed_Data() work
 
@@ -186,37 +280,54 @@ def diff(A,B):
         N/A    
     """      
 
-    keys = set([])
-    keys.update( A.keys() )
-    keys.update( B.keys() )
-
-    if isinstance(A,Diffed_Data):
-        keys.remove('_base')
-        keys.remove('_diff')
-
     result = type(A)()
     result.clear()
 
-    for key in keys:
-        va = A.get(key,None)
-        vb = B.get(key,None)
-        if isinstance(va,Data) and isinstance(vb,Data):
-            sub_diff = diff(va,vb)
-            if sub_diff:
-                result[key] = sub_diff
+    # walk the trees with an explicit stack, sub diffs are attached as they are
+    # found and the empty ones are dropped once the walk is done
+    stack     = [(A,B,result)]
+    sub_diffs = []
+    while stack:
+        a, b, res = stack.pop()
 
-        elif isinstance(va,Data) or isinstance(vb,Data):
-            result[key] = va
-            
-        elif isinstance(va,DataOrdered) and isinstance(vb,DataOrdered):
-            sub_diff = diff(va,vb)
-            if sub_diff:
-                result[key] = sub_diff
+        # nothing differs between an object and itself
+        if a is b:
+            continue
+
+        keys = dict.keys(a) | dict.keys(b)
+
+        if isinstance(a,Diffed_Data):
+            keys -= _diffed_keys
+
+        for key in keys:
+            va = a.get(key,None)
+            vb = b.get(key,None)
+            if (isinstance(va,Data) and isinstance(vb,Data)) or \
+               (isinstance(va,DataOrdered) and isinstance(vb,DataOrdered)):
+                sub_diff = type(va)()
+                sub_diff.clear()
+                res[key] = sub_diff
+                sub_diffs.append((res,key,sub_diff))
+                stack.append((va,vb,sub_diff))
+
+            elif isinstance(va,(Data,DataOrdered)) or isinstance(vb,(Data,DataOrdered)):
+                res[key] = va
+
+            # arrays compare as a whole, everything else with a plain comparison
+            elif isinstance(va,np.ndarray) or isinstance(vb,np.ndarray):
+                if not np.array_equal(va,vb):
+                    res[key] = va
 
-        elif isinstance(va,DataOrdered) or isinstance(vb,DataOrdered):
-            result[key] = va        
+            else:
+                try:
+                    if va != vb:
+                        res[key] = va
+                except ValueError: # containers of arrays
+                    res[key] = va
 
-        elif not np.all(va == vb):
-            result[key] = va
+    # children are found after their parents, so going backwards empties the tree bottom up
+    for res, key, sub_diff in reversed(sub_diffs):
+        if not sub_diff:
+            dict.__delitem__(res,key)
 
-    return result    
\ No newline at end of file
+    return result
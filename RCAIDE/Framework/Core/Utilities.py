@@ -20,48 +20,164 @@ def interp2d(x,y,xp,yp,zp,fill_value= None):
     Bilinear interpolation on a grid. ``CartesianGrid`` is much faster if the data
     lies on a regular grid.
     Args:
-        x, y: 1D arrays of point at which to interpolate. Any out-of-bounds
-            coordinates will be clamped to lie in-bounds.
+        x, y: arrays of points at which to interpolate, of matching shape. A
+            batch of query sets can be passed as 2D arrays of shape (B, N) and
+            is evaluated in one vectorized pass. Any out-of-bounds coordinates
+            will be clamped to lie in-bounds.
         xp, yp: 1D arrays of points specifying grid points where function values
             are provided.
         zp: 2D array of function values. For a function `f(x, y)` this must
             satisfy `zp[i, j] = f(xp[i], yp[j])`
     Returns:
-        1D array `z` satisfying `z[i] = f(x[i], y[i])`.
+        array `z` with the shape of `x` satisfying `z[i] = f(x[i], y[i])`.
     """ 
     ix = np.clip(np.searchsorted(xp, x, side="right"), 1, len(xp) - 1)
     iy = np.clip(np.searchsorted(yp, y, side="right"), 1, len(yp) - 1)
 
     # Using Wikipedia's notation (https://en.wikipedia.org/wiki/Bilinear_interpolation)
-    z_11 = zp[ix - 1, iy - 1]
-    z_21 = zp[ix, iy - 1]
-    z_12 = zp[ix - 1, iy]
-    z_22 = zp[ix, iy]
-
-    z_xy1 = (xp[ix] - x) / (xp[ix] - xp[ix - 1]) * z_11 + (x - xp[ix - 1]) / (
-        xp[ix] - xp[ix - 1]
-    ) * z_21
-    z_xy2 = (xp[ix] - x) / (xp[ix] - xp[ix - 1]) * z_12 + (x - xp[ix - 1]) / (
-        xp[ix] - xp[ix - 1]
-    ) * z_22
-
-    z = (yp[iy] - y) / (yp[iy] - yp[iy - 1]) * z_xy1 + (y - yp[iy - 1]) / (
-        yp[iy] - yp[iy - 1]
-    ) * z_xy2
+    # the corners are gathered from the flattened grid with one shared index
+    n_y  = zp.shape[1]
+    zp_f = zp.ravel()
+    k_11 = (ix - 1) * n_y + (iy - 1)
+    z_11 = zp_f[k_11]
+    z_12 = zp_f[k_11 + 1]
+    z_21 = zp_f[k_11 + n_y]
+    z_22 = zp_f[k_11 + (n_y + 1)]
+
+    # interpolation weights, with each bracket width found once
+    xp_l = xp[ix - 1]
+    yp_l = yp[iy - 1]
+    w_x  = (x - xp_l) / (xp[ix] - xp_l)
+    w_y  = (y - yp_l) / (yp[iy] - yp_l)
+
+    # linear in x along both y edges, then linear in y between them
+    z_xy1  = (z_21 - z_11) * w_x
+    z_xy1 += z_11
+    z_xy2  = (z_22 - z_12) * w_x
+    z_xy2 += z_12
+
+    z  = (z_xy2 - z_xy1) * w_y
+    z += z_xy1
 
     if fill_value is not None:
-        oob = np.logical_or(
-            x < xp[0], np.logical_or(x > xp[-1], np.logical_or(y < yp[0], y > yp[-1]))
-        )
-        z = np.where(oob, fill_value, z)
+        oob = (x < xp[0]) | (x > xp[-1]) | (y < yp[0]) | (y > yp[-1])
+        if isinstance(z,np.ndarray):
+            np.putmask(z, oob, fill_value)
+        else:
+            z = np.where(oob, fill_value, z)
 
     return z
 
+# ----------------------------------------------------------------------------------------------------------------------
+#  Interp2D
+# ----------------------------------------------------------------------------------------------------------------------
+
+class Interp2D(object):
+    """Bilinear interpolant on a fixed grid. Performs the same interpolation as
+    ``interp2d`` but does the per-grid setup once, so repeated evaluations on
+    the same table (e.g. inside an iteration loop) only pay for the lookup.
+
+    Assumptions:
+    xp and yp are sorted in increasing order. zp is copied on construction, so
+    later changes to the source table are not seen by the interpolant. Results
+    agree with ``interp2d`` to round-off, the cell widths being applied as
+    precomputed reciprocals.
+
+    Source:
+    https://en.wikipedia.org/wiki/Bilinear_interpolation
+
+    Inputs:
+    xp, yp      [-] 1D arrays of grid points
+    zp          [-] 2D array of function values, zp[i, j] = f(xp[i], yp[j])
+    fill_value  [-] value returned outside the grid, None clamps to the grid
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    def __init__(self,xp,yp,zp,fill_value=None):
+        xp = np.asarray(xp)
+        yp = np.asarray(yp)
+        zp = np.array(zp)
+        
+        # the corners are gathered from the flattened grid, which is only valid for a 2D table
+        if zp.ndim != 2:
+            raise ValueError('zp must be a 2D array of function values')
+
+        self.xp         = xp
+        self.yp         = yp
+        self.fill_value = fill_value
+
+        self._n_y    = zp.shape[1]
+        self._zp_f   = zp.ravel()
+        self._inv_dx = 1. / np.diff(xp)
+        self._inv_dy = 1. / np.diff(yp)
+        self._x_lims = (xp[0], xp[-1])
+        self._y_lims = (yp[0], yp[-1])
+
+    def __call__(self,x,y):
+        """Evaluates the interpolant at points (x, y) of matching shape.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        x, y      [-] arrays of points at which to interpolate
+
+        Outputs:
+        z         [-] array with the shape of x, z[i] = f(x[i], y[i])
+
+        Properties Used:
+        N/A
+        """
+        xp   = self.xp
+        yp   = self.yp
+        n_y  = self._n_y
+        zp_f = self._zp_f
+
+        ix = np.clip(np.searchsorted(xp, x, side="right"), 1, len(xp) - 1) - 1
+        iy = np.clip(np.searchsorted(yp, y, side="right"), 1, len(yp) - 1) - 1
+
+        k_11 = ix * n_y + iy
+        z_11 = zp_f[k_11]
+        z_12 = zp_f[k_11 + 1]
+        z_21 = zp_f[k_11 + n_y]
+        z_22 = zp_f[k_11 + (n_y + 1)]
+
+        w_x  = (x - xp[ix]) * self._inv_dx[ix]
+        w_y  = (y - yp[iy]) * self._inv_dy[iy]
+
+        z_xy1  = (z_21 - z_11) * w_x
+        z_xy1 += z_11
+        z_xy2  = (z_22 - z_12) * w_x
+        z_xy2 += z_12
+
+        z  = (z_xy2 - z_xy1) * w_y
+        z += z_xy1
+
+        fill_value = self.fill_value
+        if fill_value is not None:
+            x_lo, x_hi = self._x_lims
+            y_lo, y_hi = self._y_lims
+            oob = (x < x_lo) | (x > x_hi) | (y < y_lo) | (y > y_hi)
+            if isinstance(z,np.ndarray):
+                np.putmask(z, oob, fill_value)
+            else:
+                z = np.where(oob, fill_value, z)
+
+        return z
+
 # ----------------------------------------------------------------------------------------------------------------------
 # orientation_product
 # ----------------------------------------------------------------------------------------------------------------------
  
-def orientation_product(T,Bb):
+def orientation_product(T,Bb,out=None):
     """Computes the product of a tensor and a vector.
 
     Assumptions:
@@ -74,6 +190,9 @@ def orientation_product(T,Bb):
     T         [-] 3-dimensional array with rotation matrix
                   patterned along dimension zero
     Bb        [-] 3-dimensional vector
+    out       [-] optional preallocated array for the result, e.g. reused across
+                  time steps; must have the shape and dtype of the result and
+                  must not overlap T or Bb
 
     Outputs:
     C         [-] transformed vector
@@ -85,9 +204,9 @@ def orientation_product(T,Bb):
     assert T.ndim == 3
     
     if Bb.ndim == 3:
-        C = np.einsum('aij,ajk->aik', T, Bb )
+        C = np.matmul(T, Bb, out=out)
     elif Bb.ndim == 2:
-        C = np.einsum('aij,aj->ai', T, Bb )
+        C = np.einsum('aij,aj->ai', T, Bb, out=out)
     else:
         raise Exception('bad B rank')
         
@@ -97,7 +216,7 @@ def orientation_product(T,Bb):
 # orientation_transpose
 # ----------------------------------------------------------------------------------------------------------------------
 
-def orientation_transpose(T):
+def orientation_transpose(T,contiguous=False):
     """Computes the transpose of a tensor.
 
     Assumptions:
@@ -107,11 +226,14 @@ def orientation_transpose(T):
     N/A
 
     Inputs:
-    T         [-] 3-dimensional array with rotation matrix
-                  patterned along dimension zero
+    T          [-] 3-dimensional array with rotation matrix
+                   patterned along dimension zero
+    contiguous [-] if True return a C-contiguous copy rather than a strided
+                   view, worthwhile only when the transpose is reused in
+                   several products
 
     Outputs:
-    Tt        [-] transformed tensor
+    Tt         [-] transformed tensor
 
     Properties Used:
     N/A
@@ -120,6 +242,8 @@ def orientation_transpose(T):
     assert T.ndim == 3
     
     Tt = np.swapaxes(T,1,2)
+    if contiguous:
+        Tt = np.ascontiguousarray(Tt)
         
     return Tt
 
@@ -127,11 +251,12 @@ def orientation_transpose(T):
 # angles_to_dcms
 # ----------------------------------------------------------------------------------------------------------------------
 
-def angles_to_dcms(rotations,sequence=(2,1,0)):
+def angles_to_dcms(rotations,sequence=(2,1,0),dtype=None):
     """Builds an euler angle rotation matrix
     
     Assumptions:
-    N/A
+    Arrays from other backends that follow the NumPy array function protocol, e.g. 
+    CuPy, are accepted and the result is allocated on the same backend
 
     Source:
     N/A
@@ -139,6 +264,8 @@ def angles_to_dcms(rotations,sequence=(2,1,0)):
     Inputs:
     rotations     [radians]  [r1s r2s r3s], column array of rotations
     sequence      [-]        (2,1,0) (default), (2,1,2), etc.. a combination of three column indices
+    dtype         [-]        data type of the result, e.g. np.float32 for large sweeps, defaults to
+                             complex128 for complex rotations and float64 otherwise
 
     Outputs:
     transform     [-]        3-dimensional array with direction cosine matrices
@@ -147,25 +274,118 @@ def angles_to_dcms(rotations,sequence=(2,1,0)):
     Properties Used:
     N/A
     """         
-    # transform map
-    Ts = { 0:T0, 1:T1, 2:T2 }
+    # the default yaw, pitch, roll sequence has a closed form
+    if dtype is None:
+        dtype = np.complex128 if np.iscomplexobj(rotations) else np.float64
+    
+    if tuple(sequence) == (2,1,0):
+        n_a       = len(rotations)
+        transform = np.empty((n_a,3,3),dtype=dtype,like=rotations)
+        _dcms_210(rotations,transform.reshape(n_a,9).T)
+        return transform
     
     # a bunch of eyes
-    transform = new_tensor(rotations[:,0])
+    transform = new_tensor(rotations[:,0],dtype)
     
     # build the tranform
     for dim in sequence[::-1]:
         angs = rotations[:,dim]
-        transform = orientation_product( transform, Ts[dim](angs) )
+        transform = orientation_product( transform, _ROT_FNS[dim](angs,dtype) )
     
     # done!
     return transform
 
+# ----------------------------------------------------------------------------------------------------------------------
+# angles_to_dcms_soa
+# ----------------------------------------------------------------------------------------------------------------------
+
+def angles_to_dcms_soa(rotations,sequence=(2,1,0),dtype=None):
+    """Builds euler angle rotation matrices stored entry by entry, so that each entry of 
+    every matrix is contiguous in memory
+    
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    rotations     [radians]  [r1s r2s r3s], column array of rotations
+    sequence      [-]        (2,1,0) (default), (2,1,2), etc.. a combination of three column indices
+    dtype         [-]        data type of the result, e.g. np.float32 for large sweeps, defaults to
+                             complex128 for complex rotations and float64 otherwise
+
+    Outputs:
+    entries       [-]        2-dimensional array, shape (9,n), with the direction cosine matrix 
+                             entries R00, R01, R02, R10, ... R22 along dimension zero
+
+    Properties Used:
+    N/A
+    """         
+    
+    if dtype is None:
+        dtype = np.complex128 if np.iscomplexobj(rotations) else np.float64
+    
+    if tuple(sequence) == (2,1,0):
+        entries = np.empty((9,len(rotations)),dtype=dtype,like=rotations)
+        _dcms_210(rotations,entries)
+    else:
+        transform = angles_to_dcms(rotations,sequence,dtype)
+        entries   = np.ascontiguousarray(transform.reshape(len(rotations),9).T)
+    
+    return entries
+
+# ----------------------------------------------------------------------------------------------------------------------
+# _dcms_210
+# ----------------------------------------------------------------------------------------------------------------------  
+
+def _dcms_210(rotations,entries):
+    """Fills the direction cosine matrices for the (2,1,0) sequence, T0(r0) T1(r1) T2(r2),
+    entry by entry instead of multiplying the three rotation matrices
+    
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    rotations     [radians]  [r1s r2s r3s], column array of rotations
+    entries       [-]        array indexed [entry,point], entries in row major order R00, R01, ... R22
+
+    Outputs:
+    entries       [-]        filled in place
+
+    Properties Used:
+    N/A
+    """      
+    c0 = np.cos(rotations[:,0])
+    s0 = np.sin(rotations[:,0])
+    c1 = np.cos(rotations[:,1])
+    s1 = np.sin(rotations[:,1])
+    c2 = np.cos(rotations[:,2])
+    s2 = np.sin(rotations[:,2])
+    
+    s0s1 = s0*s1
+    c0s1 = c0*s1
+    
+    entries[0] = c1*c2
+    entries[1] = c1*s2
+    entries[2] = -s1
+    entries[3] = s0s1*c2 - c0*s2
+    entries[4] = s0s1*s2 + c0*c2
+    entries[5] = s0*c1
+    entries[6] = c0s1*c2 + s0*s2
+    entries[7] = c0s1*s2 - s0*c2
+    entries[8] = c0*c1
+    
+    return entries
+
 # ----------------------------------------------------------------------------------------------------------------------
 # T0
 # ----------------------------------------------------------------------------------------------------------------------  
 
-def T0(a):
+def T0(a,dtype=None):
     """Rotation matrix about first axis
     
     Assumptions:
@@ -176,6 +396,8 @@ def T0(a):
 
     Inputs:
     a        [radians] angle of rotation
+    dtype    [-]       data type of the result, defaults to complex128 for
+                       complex angles and float64 otherwise
 
     Outputs:
     T        [-]       rotation matrix
@@ -187,23 +409,13 @@ def T0(a):
     #               [0, cos,sin],
     #               [0,-sin,cos]])
     
-    cos = np.cos(a)
-    sin = np.sin(a)
-                  
-    T = new_tensor(a)
-    
-    T[:,1,1] = cos
-    T[:,1,2] = sin
-    T[:,2,1] = -sin
-    T[:,2,2] = cos
-    
-    return T
+    return _make_rot(0,a,dtype)
 
 # ----------------------------------------------------------------------------------------------------------------------
 # T1
 # ----------------------------------------------------------------------------------------------------------------------          
 
-def T1(a):
+def T1(a,dtype=None):
     """Rotation matrix about second axis
     
     Assumptions:
@@ -214,6 +426,8 @@ def T1(a):
 
     Inputs:
     a        [radians] angle of rotation
+    dtype    [-]       data type of the result, defaults to complex128 for
+                       complex angles and float64 otherwise
 
     Outputs:
     T        [-]       rotation matrix
@@ -225,23 +439,13 @@ def T1(a):
     #               [0  ,1,   0],
     #               [sin,0, cos]])
     
-    cos = np.cos(a)
-    sin = np.sin(a)     
-    
-    T = new_tensor(a)
-    
-    T[:,0,0] = cos
-    T[:,0,2] = -sin
-    T[:,2,0] = sin
-    T[:,2,2] = cos
-    
-    return T
+    return _make_rot(1,a,dtype)
 
 # ----------------------------------------------------------------------------------------------------------------------
 # T2
 # ----------------------------------------------------------------------------------------------------------------------  
 
-def T2(a):
+def T2(a,dtype=None):
     """Rotation matrix about third axis
     
     Assumptions:
@@ -252,6 +456,8 @@ def T2(a):
 
     Inputs:
     a        [radians] angle of rotation
+    dtype    [-]       data type of the result, defaults to complex128 for
+                       complex angles and float64 otherwise
 
     Outputs:
     T        [-]       rotation matrix
@@ -263,23 +469,63 @@ def T2(a):
     #               [-sin,cos,0],
     #               [0   ,0  ,1]])
         
+    return _make_rot(2,a,dtype)
+
+# rotation about each axis, indexed by the axis
+_ROT_FNS = (T0, T1, T2)
+
+# ----------------------------------------------------------------------------------------------------------------------
+# _make_rot
+# ----------------------------------------------------------------------------------------------------------------------  
+
+def _make_rot(axis,a,dtype=None):
+    """Builds the rotation matrices about one axis, writing only the non-zero entries
+    
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    axis     [-]       axis of rotation, 0, 1 or 2
+    a        [radians] angle of rotation
+    dtype    [-]       data type of the result, defaults to complex128 for
+                       complex angles and float64 otherwise
+
+    Outputs:
+    T        [-]       3-dimensional array with rotation matrix
+                       patterned along dimension zero
+
+    Properties Used:
+    N/A
+    """      
+    assert a.ndim == 1
+    if dtype is None:
+        dtype = np.complex128 if np.iscomplexobj(a) else np.float64
+    
+    # the other two axes in cyclic order
+    i = (axis + 1) % 3
+    j = (axis + 2) % 3
+    
     cos = np.cos(a)
-    sin = np.sin(a)     
+    sin = np.sin(a)
     
-    T = new_tensor(a)
+    T = np.zeros((len(a),3,3),dtype=dtype,like=a)
+    
+    T[:,axis,axis] = 1.
+    T[:,i,i] = cos
+    T[:,i,j] = sin
+    T[:,j,i] = -sin
+    T[:,j,j] = cos
     
-    T[:,0,0] = cos
-    T[:,0,1] = sin
-    T[:,1,0] = -sin
-    T[:,1,1] = cos
-        
     return T
 
 # ----------------------------------------------------------------------------------------------------------------------
 # new_tensor
 # ----------------------------------------------------------------------------------------------------------------------  
 
-def new_tensor(a):
+def new_tensor(a,dtype=None):
     """Initializes the required tensor. Able to handle imaginary values.
     
     Assumptions:
@@ -290,6 +536,8 @@ def new_tensor(a):
 
     Inputs:
     a        [radians] angle of rotation
+    dtype    [-]       data type of the result, defaults to complex128 for
+                       complex angles and float64 otherwise
 
     Outputs:
     T        [-]       3-dimensional array with identity matrix
@@ -301,11 +549,11 @@ def new_tensor(a):
     assert a.ndim == 1
     n_a = len(a)
     
-    T = np.eye(3)
-    
-    if a.dtype is np.dtype('complex'):
-        T = T + 0j
+    if dtype is None:
+        dtype = np.complex128 if np.iscomplexobj(a) else np.float64
     
-    T = np.resize(T,[n_a,3,3])
+    # identity on the diagonal, flat positions 0, 4 and 8 of each 3x3
+    T = np.zeros((n_a,3,3),dtype=dtype,like=a)
+    T.reshape(n_a,9)[:,::4] = 1.
     
     return T
\ No newline at end of file
@@ -7,7 +7,7 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import os, sys, shutil, copy
+import os, sys, shutil, copy, contextlib
 
 # -------------------------------------------------------------------
 #  Output Redirection 
@@ -24,15 +24,19 @@ class output(object):
         #: with output redirection
         
         Inputs:
-            stdout - None, a filename, or a file stream
-            stderr - None, a filename, or a file stream
+            stdout    - None, a filename, or a file stream
+            stderr    - None, a filename, or a file stream
+            buffering - buffer size in bytes for files opened by name,
+                        default 1 MiB. Output is written out on exit of
+                        the 'with' block; pass 1 for line buffering if
+                        the log must be followed while the block runs
         None will not redirect outptut
         
         Source:
         http://stackoverflow.com/questions/6796492/python-temporarily-redirect-stdout-stderr
         
     """
-    def __init__(self, stdout=None, stderr=None):
+    def __init__(self, stdout=None, stderr=None, buffering=1<<20):
         """ Initializes a new output() class
     
             Assumptions:
@@ -42,7 +46,9 @@ class output(object):
             N/A
     
             Inputs:
-            N/A
+            stdout    - None, a filename, or a file stream
+            stderr    - None, a filename, or a file stream
+            buffering - buffer size in bytes for files opened by name
     
             Outputs:
             N/A
@@ -55,10 +61,10 @@ class output(object):
         _newerr = False
         
         if isinstance(stdout,str):
-            stdout = open(stdout,'a')
+            stdout = open(stdout,'a',buffering=buffering)
             _newout = True            
         if isinstance(stderr,str):
-            stderr = open(stderr,'a')
+            stderr = open(stderr,'a',buffering=buffering)
             _newerr = True                   
                 
         self._stdout = stdout or sys.stdout
@@ -69,17 +75,21 @@ class output(object):
     def __enter__(self):
         self.old_stdout, self.old_stderr = sys.stdout, sys.stderr
         self.old_stdout.flush(); self.old_stderr.flush()
-        sys.stdout, sys.stderr = self._stdout, self._stderr
-
-    def __exit__(self, exc_type, exc_value, traceback):
-        self._stdout.flush(); self._stderr.flush()
-        sys.stdout = self.old_stdout
-        sys.stderr = self.old_stderr
         
+        # exit callbacks run in reverse: flush, restore streams, then close
+        stack = contextlib.ExitStack()
         if self._newout:
-            self._stdout.close()
+            stack.callback(self._stdout.close)
         if self._newerr:
-            self._stderr.close()           
+            stack.callback(self._stderr.close)
+        stack.enter_context(contextlib.redirect_stdout(self._stdout))
+        stack.enter_context(contextlib.redirect_stderr(self._stderr))
+        stack.callback(self._stderr.flush)
+        stack.callback(self._stdout.flush)
+        self._stack = stack
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._stack.__exit__(exc_type, exc_value, traceback)
 
 
 # -------------------------------------------------------------------
@@ -172,7 +182,7 @@ class folder(object):
             if os.path.exists( new_name ): 
                 if force: os.remove( new_name )
                 else: continue
-            shutil.copy(old_name,new_name)
+            copy_file(old_name,new_name)
 
         # make links
         for name in link:
@@ -229,6 +239,41 @@ class folder(object):
         # change directory
         os.chdir(origin)
         
+
+def copy_file(src,dst):
+    """ copy_file(src,dst)
+        copies a file and its permission bits, as shutil.copy
+        Inputs:
+            src - source file
+            dst - destination file
+        
+        Where the platform has os.copy_file_range (Linux) the data is
+        copied inside the kernel, which lets copy-on-write filesystems
+        (Btrfs, XFS) share the extents instead of duplicating them.
+        Falls back to shutil.copy otherwise, if the kernel refuses, or if
+        it copies nothing or less than the reported size (as for /proc files).
+    """
+    
+    if not hasattr(os,'copy_file_range'):
+        shutil.copy(src,dst)
+        return
+    
+    try:
+        with open(src,'rb') as fsrc, open(dst,'wb') as fdst:
+            n_size  = os.fstat(fsrc.fileno()).st_size
+            n_total = 0
+            
+            # the reported size is only a hint, copy until the kernel has nothing left
+            while True:
+                n_copy = os.copy_file_range(fsrc.fileno(),fdst.fileno(),max(n_size-n_total,2**20))
+                if n_copy == 0: break
+                n_total += n_copy
+        if n_total == 0 or n_total < n_size:
+            shutil.copyfile(src,dst)
+        shutil.copymode(src,dst)
+    except OSError:
+        shutil.copy(src,dst)
+        
   
 def make_link(src,dst):
     """ make_link(src,dst)
@@ -21,6 +21,8 @@ from RCAIDE.Framework.External_Interfaces.OpenVSP.get_vsp_measurements import ge
 
 
 from copy import deepcopy
+import functools
+import os
 
 try:
     import vsp as vsp
@@ -34,7 +36,7 @@ except ImportError:
 # ---------------------------------------------------------------------------------------------------------------------- 
 #  vsp read
 # ---------------------------------------------------------------------------------------------------------------------- 
-def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type='SI',use_scaling=True,calculate_wetted_area=True): 
+def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type='SI',use_scaling=True,calculate_wetted_area=True,verbose=True): 
     """This reads an OpenVSP vehicle geometry and writes it into a RCAIDE vehicle format.
     Includes wings, fuselages, and rotors.
 
@@ -57,6 +59,7 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
     2. Units_type set to 'SI' (default) or 'Imperial'
     3. User-specified network
     4. Boolean for whether or not to use the scaling from OpenVSP (default = True).
+    5. Boolean for whether or not to print the VSP geometry IDs (default = True).
 
     Outputs:
     Writes RCAIDE vehicle with these geometries from VSP:    (All values default to SI. Any other 2nd argument outputs Imperial.)
@@ -139,6 +142,7 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
     
     vsp_geoms         = vsp.FindGeoms()
     geom_names        = []
+    name_by_id        = {}
 
     vehicle           = RCAIDE.Vehicle()
     vehicle.tag       = tag 
@@ -150,48 +154,50 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
     else:
         units_type = 'imperial'	
 
-    # The two for-loops below are in anticipation of an OpenVSP API update with a call for GETGEOMTYPE.
     # This print function allows user to enter VSP GeomID manually as first argument in import_vsp_vehicle functions.
 
-    print("VSP geometry IDs: ")	
+    if verbose:
+        print("VSP geometry IDs: ")	
 
-    # Label each geom type by storing its VSP geom ID. 
+    # ------------------------------------------------------------------
+    # AUTOMATIC VSP ENTRY & PROCESSING
+    # ------------------------------------------------------------------		
 
+    # list each geom type is filed under, nacelle types are handled separately
+    geoms_by_type = {'Fuselage' : vsp_fuselages,
+                     'Wing'     : vsp_wings,
+                     'Propeller': vsp_rotors}
+
+    # Label each geom type by storing its VSP geom ID, querying each name and type from OpenVSP once 
     for geom in vsp_geoms: 
         geom_name = vsp.GetGeomName(geom)
+        geom_type = vsp.GetGeomTypeName(str(geom))
+        name_by_id[geom] = geom_name
         geom_names.append(geom_name)
-        print(str(geom_name) + ': ' + geom)
-        
+        if verbose:
+            print(str(geom_name) + ': ' + geom)
+
+        geom_list = geoms_by_type.get(geom_type)
+        if geom_list is not None:
+            geom_list.append(geom)
+        elif (geom_type == 'Stack') or (geom_type == 'BodyOfRevolution'):
+            vsp_nacelle_type.append(geom_type)
+            vsp_nacelles.append(geom) 
     
     # ------------------------------------------------------------------        
     # Use OpenVSP to calculate wetted area
     # ------------------------------------------------------------------
     if calculate_wetted_area:
-        measurements = get_vsp_measurements()
+        vsp_file     = os.stat(tag)
+        measurements = _cached_vsp_measurements(os.path.abspath(tag), vsp_file.st_mtime_ns, vsp_file.st_size)
         if units_type == 'SI':
             units_factor = Units.meter * 1.
         elif units_type == 'imperial':
             units_factor = Units.foot * 1.
         elif units_type == 'inches':
             units_factor = Units.inch * 1.	         
-        
-    # ------------------------------------------------------------------
-    # AUTOMATIC VSP ENTRY & PROCESSING
-    # ------------------------------------------------------------------		
-
-    for geom in vsp_geoms:
-        geom_name = vsp.GetGeomName(geom)
-        geom_type = vsp.GetGeomTypeName(str(geom))
-
-        if geom_type == 'Fuselage':
-            vsp_fuselages.append(geom)
-        if geom_type == 'Wing':
-            vsp_wings.append(geom)
-        if geom_type == 'Propeller':
-            vsp_rotors.append(geom) 
-        if (geom_type == 'Stack') or (geom_type == 'BodyOfRevolution'):
-            vsp_nacelle_type.append(geom_type)
-            vsp_nacelles.append(geom) 
+        units_factor_sq = units_factor * units_factor
+        wetted_by_name  = {name: area * units_factor_sq for name, area in measurements.items()}
         
     # ------------------------------------------------------------------			
     # Read Fuselages 
@@ -209,7 +215,7 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
             fuselage = read_vsp_fuselage(fuselage_id,fux_idx,sym_flag[fux_idx],units_type,use_scaling)
             
             if calculate_wetted_area:
-                fuselage.areas.wetted = measurements[vsp.GetGeomName(fuselage_id)] * (units_factor**2)
+                fuselage.areas.wetted = wetted_by_name[name_by_id[fuselage_id]]
             
             vehicle.append_component(fuselage)
         
@@ -219,7 +225,7 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
     for wing_id in vsp_wings:
         wing = read_vsp_wing(wing_id, units_type,use_scaling)
         if calculate_wetted_area:
-            wing.areas.wetted = measurements[vsp.GetGeomName(wing_id)] * (units_factor**2)  
+            wing.areas.wetted = wetted_by_name[name_by_id[wing_id]]  
         vehicle.append_component(wing)		 
         
     # ------------------------------------------------------------------			    
@@ -236,13 +242,13 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
             
             # Rotor 
             rotor           = read_vsp_rotor(rotor_id,units_type)
-            rotor.tag       = vsp.GetGeomName(rotor_id) 
+            rotor.tag       = name_by_id[rotor_id] 
             propulsor.rotor = rotor
             
             # Nacelle 
             nacelle = read_vsp_nacelle(nacelle_id,vsp_nacelle_type[idx], units_type)
             if calculate_wetted_area:
-                nacelle.areas.wetted = measurements[vsp.GetGeomName(nacelle_id)] * (units_factor**2)           
+                nacelle.areas.wetted = wetted_by_name[name_by_id[nacelle_id]]           
             propulsor.nacelle = nacelle          
              
             # Append to Network 
@@ -269,7 +275,7 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
                 nacelle_sym = deepcopy(nacelle)
                 nacelle_sym.origin[0][1] = - nacelle_sym.origin[0][1]  
                 nacelle_sym.areas.wetted = nacelle.areas.wetted
-                propulsor.nacelle = nacelle          
+                propulsor.nacelle = nacelle_sym          
                  
                 # Append to Network             
                 network.propulsors.append(propulsor)
@@ -285,7 +291,7 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
             # Nacelle 
             nacelle = read_vsp_nacelle(nacelle_id,vsp_nacelle_type[idx], units_type)
             if calculate_wetted_area:
-                nacelle.areas.wetted = measurements[vsp.GetGeomName(nacelle_id)] * (units_factor**2)           
+                nacelle.areas.wetted = wetted_by_name[name_by_id[nacelle_id]]           
             propulsor.nacelle = nacelle          
              
             # Append to Network 
@@ -306,7 +312,7 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
                 nacelle_sym = deepcopy(nacelle)
                 nacelle_sym.origin[0][1] = - nacelle_sym.origin[0][1]  
                 nacelle_sym.areas.wetted = nacelle.areas.wetted
-                propulsor.nacelle = nacelle          
+                propulsor.nacelle = nacelle_sym          
                  
                 # Append to Network             
                 network.propulsors.append(propulsor)
@@ -322,7 +328,7 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
             
             # Rotor 
             rotor           = read_vsp_rotor(rotor_id,units_type)
-            rotor.tag       = vsp.GetGeomName(rotor_id) 
+            rotor.tag       = name_by_id[rotor_id] 
             propulsor.rotor = rotor
             
             # Append to Network 
@@ -343,7 +349,6 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
                 rotor_sym = deepcopy(rotor)
                 rotor_sym.origin[0][1] = - rotor_sym.origin[0][1] 
                 propulsor.rotor = rotor_sym  
-                propulsor.nacelle = nacelle          
                  
                 # Append to Network             
                 network.propulsors.append(propulsor) 
@@ -353,4 +358,33 @@ def import_vsp_vehicle(tag,network_type=None, propulsor_type = None, units_type=
                 
     vehicle.networks.append(network)
 
-    return vehicle
\ No newline at end of file
+    return vehicle
+
+# ---------------------------------------------------------------------------------------------------------------------- 
+#  cached vsp measurements
+# ---------------------------------------------------------------------------------------------------------------------- 
+@functools.lru_cache(maxsize=16)
+def _cached_vsp_measurements(vsp_file, mtime_ns, size):
+    """Runs the OpenVSP wetted area analysis for the model just read from vsp_file. Repeated imports
+    of an unchanged file reuse the first result instead of rerunning CompGeom.
+
+    Assumptions:
+    The OpenVSP model currently loaded was read from vsp_file and has not been edited since. The
+    returned dictionary is shared between calls and must not be modified. Call
+    _cached_vsp_measurements.cache_clear() if the model is changed in memory.
+
+    Source:
+    N/A
+
+    Inputs:
+    vsp_file      <string>  absolute path of the .vsp3 file
+    mtime_ns      [ns]      modification time of the file
+    size          [bytes]   size of the file
+
+    Outputs:
+    measurements  [m^2]     dictionary of wetted areas with component tags as the keys
+
+    Properties Used:
+    N/A
+    """
+    return get_vsp_measurements()
@@ -54,51 +54,42 @@ def mach_slices(vehicle,mach,angle_of_attack=[0.],number_slices = 99):
     X_locs_all       = []
     slice_areas_all = []
     
-    for ii in range(len(mach)):
-        
-        m   = mach[ii] 
-        
-        if len(angle_of_attack)>1:
-            aoa = angle_of_attack[ii]
-        else:
-            aoa = angle_of_attack[0]
-        
+    # One angle of attack applies to every mach number, otherwise one per mach number
+    mach = np.ravel(mach)
+    aoa  = np.ravel(angle_of_attack)
+    if len(aoa) == 1:
+        aoa = np.broadcast_to(aoa,mach.shape)
     
-        # Calculate the mach angle and adjust for AoA
-        mach_angle = np.arcsin(1/m)
-        roty = (np.pi/2-mach_angle) + aoa
-        
-        # Take the components of the X and Z axis to get the slicing plane
-        x_component = np.cos(roty)
-        z_component = np.sin(roty)
+    # Calculate the mach angles and adjust for AoA
+    mach_angles = np.arcsin(1/mach)
+    rotys       = (np.pi/2-mach_angles) + aoa
+    tan_mach    = np.tan(mach_angles)
+    
+    # Take the components of the X and Z axis to get the slicing planes
+    x_components = np.cos(rotys)
+    z_components = np.sin(rotys)
+    
+    for ii in range(len(mach)):
         
         # Now slice it 
-        vsp.ComputePlaneSlice( 0, number_slices, vsp.vec3d(x_component[0], 0.0, z_component[0]), True)
+        vsp.ComputePlaneSlice( 0, number_slices, vsp.vec3d(x_components[ii], 0.0, z_components[ii]), True)
         
         # Pull out the areas from the slices
         pslice_results = vsp.FindLatestResultsID("Slice")
-        slice_areas    = vsp.GetDoubleResults( pslice_results, "Slice_Area" ) * np.cos(roty)
+        slice_areas    = np.asarray(vsp.GetDoubleResults( pslice_results, "Slice_Area" )) * x_components[ii]
         vec3d          = vsp.GetVec3dResults(pslice_results, "Slice_Area_Center")
         
-        X = []
-        Z = []
-        
-        for v in vec3d:
-            X.append(v.x())
-            Z.append(v.z())
-        
-        X = np.array(X)
-        Z = np.array(Z)
+        # Slice centers straight into one (n,2) array of x and z
+        XZ = np.fromiter((c for v in vec3d for c in (v.x(), v.z())), dtype=np.float64, count=2*len(vec3d)).reshape(-1,2)
+        X  = XZ[:,0]
+        Z  = XZ[:,1]
             
-        X_locs = X + Z*np.tan(mach_angle)
+        np.multiply(Z, tan_mach[ii], out=Z)
+        X_locs = X + Z
         
         if slice_areas[-1]==0.:
             slice_areas = slice_areas[0:-1]
             X_locs      = X_locs[:-1]
-            
-        # Turn them into arrays
-        X_locs      = np.array(X_locs)
-        slice_areas = np.array(slice_areas)
         
         # A vectorized Output
         X_locs_all.append(X_locs)
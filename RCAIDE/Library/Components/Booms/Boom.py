@@ -205,7 +205,8 @@ class Boom(Component):
         return 
 
 class Container(Component.Container):
-    def get_children(self):
+    @classmethod
+    def get_children(cls):
         """ :meta private: """
         #Returns the components that can go inside
     
@@ -221,7 +222,7 @@ class Container(Component.Container):
         #Outputs:
         #    Boom       : boom               [unitless] 
         
-        return [Boom]
+        return (Boom,)
 
 # ------------------------------------------------------------
 #  Handle Linking
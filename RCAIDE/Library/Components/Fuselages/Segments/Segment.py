@@ -112,13 +112,14 @@ class Segment_Container(Container):
         The segment components stored in this container
     """     
 
-    def get_children(self):
+    @classmethod
+    def get_children(cls):
         """
         Returns a list of allowable child component types for the segment container.
 
         Returns
         -------
-        list
-            Empty list as segments do not contain child components
+        tuple
+            Empty tuple as segments do not contain child components
         """       
-        return []
\ No newline at end of file
+        return ()
\ No newline at end of file
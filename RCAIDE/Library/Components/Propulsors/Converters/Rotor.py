@@ -470,7 +470,8 @@ class Airfoil_Container(Container):
     N/A
     """     
 
-    def get_children(self):
+    @classmethod
+    def get_children(cls):
         """ Returns the components that can go inside
         
         Assumptions:
@@ -489,4 +490,4 @@ class Airfoil_Container(Container):
         N/A
         """       
         
-        return []
+        return ()
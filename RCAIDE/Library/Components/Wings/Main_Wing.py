@@ -85,16 +85,17 @@ class Segment_Container(Container):
         The segment components stored in this container
     """     
 
-    def get_children(self):
+    @classmethod
+    def get_children(cls):
         """
         Returns a list of allowable child component types for the segment container.
 
         Returns
         -------
-        list
-            List containing the Segment class as the only allowable child type
+        tuple
+            Tuple containing the Segment class as the only allowable child type
         """       
-        return [Segment] 
+        return (Segment,) 
     
     def append(self, val):
         """
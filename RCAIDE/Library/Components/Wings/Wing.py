@@ -12,6 +12,7 @@ from RCAIDE.Library.Components  import Mass_Properties, Component
 from RCAIDE.Library.Methods.Weights.Moment_of_Inertia.compute_wing_moment_of_inertia import  compute_wing_moment_of_inertia
 
 import numpy as np
+import functools
 
 # ---------------------------------------------------------------------------------------------------------------------- 
 #  Wing
@@ -320,7 +321,9 @@ class Wing(Component):
         return I   
     
 class Container(Component.Container):
-    def get_children(self):
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_children(cls):
         """ Returns the components that can go inside
         
         Assumptions:
@@ -342,7 +345,7 @@ class Container(Component.Container):
         from . import Vertical_Tail
         from . import Horizontal_Tail
         
-        return [Main_Wing,Vertical_Tail,Horizontal_Tail]
+        return (Main_Wing,Vertical_Tail,Horizontal_Tail)
 
 
 # ------------------------------------------------------------
@@ -17,6 +17,12 @@ from RCAIDE.Library.Attributes.Materials.Aluminum import Aluminum
 # python imports 
 import numpy as np
 
+# method family and FLOPS complexity for each supported method_type, anything else uses the RCAIDE correlations
+METHOD_TYPES = {'RCAIDE'       : ('RCAIDE', None),
+                'Raymer'       : ('Raymer', None),
+                'FLOPS Simple' : ('FLOPS' , 'Simple'),
+                'FLOPS Complex': ('FLOPS' , 'Complex')}
+
 # ---------------------------------------------------------------------------------------------------------------------- 
 # Operating Empty Weight 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -108,6 +114,8 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
             N/A
     """
     
+    method_family, complexity = METHOD_TYPES.get(method_type, ('RCAIDE', None))
+    
     if settings == None:
         W_factors = Data()
         use_max_fuel_weight = True 
@@ -135,7 +143,7 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
             W_factors.systems      = 0. 
     
     Wings = RCAIDE.Library.Components.Wings  
-    if method_type == 'FLOPS Simple' or method_type == 'FLOPS Complex':
+    if method_family == 'FLOPS':
         if vehicle.flight_envelope.design_mach_number  == None: # Added design mach number
             raise ValueError("FLOPS requires a design mach number for sizing!")
         if vehicle.flight_envelope.design_range  == None:
@@ -154,7 +162,7 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
     ##-------------------------------------------------------------------------------             
     # Payload Weight
     ##-------------------------------------------------------------------------------  
-    if method_type == 'FLOPS Simple' or method_type == 'FLOPS Complex':
+    if method_family == 'FLOPS':
         payload = FLOPS.compute_payload_weight(vehicle)
     else:
         payload = Common.compute_payload_weight(vehicle)
@@ -175,7 +183,7 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
     ##-------------------------------------------------------------------------------             
     # Operating Items Weight
     ##------------------------------------------------------------------------------- 
-    if method_type == 'FLOPS Simple' or method_type == 'FLOPS Complex':
+    if method_family == 'FLOPS':
         W_oper = FLOPS.compute_operating_items_weight(vehicle)
     else:
         W_oper = Transport.compute_operating_items_weight(vehicle)  
@@ -183,9 +191,9 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
     ##-------------------------------------------------------------------------------         
     # System Weight
     ##------------------------------------------------------------------------------- 
-    if method_type == 'FLOPS Simple' or method_type == 'FLOPS Complex':
+    if method_family == 'FLOPS':
         W_systems = FLOPS.compute_systems_weight(vehicle)
-    elif method_type == 'Raymer':
+    elif method_family == 'Raymer':
         W_systems = Raymer.compute_systems_weight(vehicle)
     else:
         W_systems = Common.compute_systems_weight(vehicle)
@@ -223,7 +231,7 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
     for network in vehicle.networks: 
         W_energy_network_total   = 0 
         # Fuel-Powered Propulsors  
-        if method_type == 'FLOPS Simple' or method_type == 'FLOPS Complex':
+        if method_family == 'FLOPS':
             W_propulsion                         = FLOPS.compute_propulsion_system_weight(vehicle, network)
             W_energy_network_total              += W_propulsion.W_prop 
             W_energy_network.W_engine           += W_propulsion.W_engine
@@ -237,7 +245,7 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
             for propulsor in network.propulsors:
                 propulsor.mass_properties.mass = W_energy_network_total / number_of_engines
             
-        elif method_type == 'Raymer':
+        elif method_family == 'Raymer':
             W_propulsion                        = Raymer.compute_propulsion_system_weight(vehicle, network) 
             W_energy_network_total              += W_propulsion.W_prop 
             W_energy_network.W_engine           += W_propulsion.W_engine
@@ -287,7 +295,7 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
     # Pod Weight Weight 
     ##-------------------------------------------------------------------------------         
     WPOD  = 0.0             
-    if method_type == 'FLOPS Complex': 
+    if complexity == 'Complex': 
         NENG   = number_of_engines
         WTNFA  = W_energy_network.W_engine + W_energy_network.W_thrust_reverser + W_energy_network.W_starter \
                 + 0.25 * W_energy_network.W_engine_controls + 0.11 * W_systems.W_instruments + 0.13 * W_systems.W_electrical \
@@ -319,10 +327,9 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
     
     for wing in vehicle.wings:
         if isinstance(wing, Wings.Main_Wing): 
-            if method_type == 'FLOPS Simple' or method_type == 'FLOPS Complex':
-                complexity = method_type.split()[1]
+            if method_family == 'FLOPS':
                 W_wing = FLOPS.compute_wing_weight(vehicle, wing, WPOD, complexity, settings, num_main_wings)
-            elif method_type == 'Raymer':
+            elif method_family == 'Raymer':
                 W_wing = Raymer.compute_main_wing_weight(vehicle, wing) 
             else:
                 W_wing = Common.compute_main_wing_weight(vehicle, wing, Al_rho, Al_sigma) 
@@ -333,9 +340,9 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
             wing.mass_properties.mass = W_wing
             W_main_wing += W_wing
         if isinstance(wing, Wings.Horizontal_Tail):
-            if method_type == 'FLOPS Simple' or method_type == 'FLOPS Complex':
+            if method_family == 'FLOPS':
                 W_tail = FLOPS.compute_horizontal_tail_weight(vehicle, wing)
-            elif method_type == 'Raymer':
+            elif method_family == 'Raymer':
                 W_tail = Raymer.compute_horizontal_tail_weight(vehicle, wing)
             else:
                 W_tail = Transport.compute_horizontal_tail_weight(vehicle, wing)
@@ -347,9 +354,9 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
             wing.mass_properties.mass = W_tail
             W_tail_horizontal += W_tail
         if isinstance(wing, Wings.Vertical_Tail):
-            if method_type == 'FLOPS Simple' or method_type == 'FLOPS Complex':
+            if method_family == 'FLOPS':
                 W_tail = FLOPS.compute_vertical_tail_weight(vehicle, wing)
-            elif method_type == 'Raymer':
+            elif method_family == 'Raymer':
                 W_tail = Raymer.compute_vertical_tail_weight(vehicle, wing)
             else:
                 W_tail = Transport.compute_vertical_tail_weight(vehicle, wing)
@@ -364,9 +371,9 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
     ##------------------------------------------------------------------------------- 
     W_fuselage_total = 0
     for fuse in vehicle.fuselages:
-        if method_type == 'FLOPS Simple' or method_type == 'FLOPS Complex':
+        if method_family == 'FLOPS':
             W_fuselage = FLOPS.compute_fuselage_weight(vehicle)
-        elif method_type == 'Raymer':
+        elif method_family == 'Raymer':
             W_fuselage = Raymer.compute_fuselage_weight(vehicle, fuse, settings)
         else:
             W_fuselage = Transport.compute_fuselage_weight(vehicle, fuse, W_main_wing, W_energy_network_cumulative)
@@ -377,9 +384,9 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
     ##-------------------------------------------------------------------------------                 
     # Landing Gear Weight
     ##------------------------------------------------------------------------------- 
-    if method_type == 'FLOPS Simple' or method_type == 'FLOPS Complex':
+    if method_family == 'FLOPS':
         landing_gear = FLOPS.compute_landing_gear_weight(vehicle)
-    elif method_type == 'Raymer':
+    elif method_family == 'Raymer':
         landing_gear = Raymer.compute_landing_gear_weight(vehicle)
     else:
         landing_gear =  Common.compute_landing_gear_weight(vehicle) 
@@ -393,7 +400,7 @@ def compute_operating_empty_weight(vehicle, settings=None, method_type='RCAIDE')
     output.empty.structural.landing_gear          = landing_gear.main +  landing_gear.nose  
     output.empty.structural.nacelle               = W_energy_network.W_nacelle
     
-    if 'FLOPS' in method_type:
+    if method_family == 'FLOPS':
         print('Paint weight is currently ignored in FLOPS calculations.')
     output.empty.structural.paint = 0  # TODO reconcile FLOPS paint calculations with Raymer and RCAIDE baseline
     output.empty.structural.total = output.empty.structural.wings   + output.empty.structural.fuselage + output.empty.structural.landing_gear\
@@ -23,14 +23,9 @@ def emissions(mission):
             None             
     """
         
-    last_tag = None
     for tag,segment in mission.segments.items():
         if segment.analyses.emissions != None:
-            if last_tag and  'compute' in mission.segments[last_tag].analyses.emissions.process: 
-                segment.analyses.emissions.process.emissions = mission.segments[last_tag].analyses.emissions.process.emissions
-                segment.analyses.emissions.surrogates        = mission.segments[last_tag].analyses.emissions.surrogates  
-            else:          
-                em   = segment.analyses.emissions
-                em.initialize()   
-                last_tag = tag
+            # each segment builds its own emissions model 
+            em   = segment.analyses.emissions
+            em.initialize()   
     return 
\ No newline at end of file
@@ -0,0 +1,58 @@
+# container_test.py
+# 
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------  
+import RCAIDE
+from RCAIDE.Framework.Core import Data, Container
+
+import copy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------  
+def main():
+    
+    # extending a plain container files every component under its tag
+    container = Container()
+    wing      = Data(tag = 'Main Wing')
+    tail      = Data(tag = 'horizontal_stabilizer')
+    container.extend([wing,tail])
+    assert(container.main_wing is wing)
+    assert(container.horizontal_stabilizer is tail)
+    
+    # extending with colliding tags falls back to append and renames the duplicates
+    container.extend([Data(tag = 'main_wing'),Data(tag = 'main_wing')])
+    assert(list(container.keys()) == ['main_wing','horizontal_stabilizer','main_wing2','main_wing3'])
+    
+    # duplicates are numbered by how many components with that tag were appended
+    container = Container()
+    for tag in ['Main Wing','main_wing','Main Wing']:
+        container.append(Data(tag = tag))
+    assert(list(container.keys()) == ['main_wing','main_wing2','main_wing3'])
+    
+    # a shallow copy shares the components but keeps its own count of appended tags
+    duplicate = copy.copy(container)
+    assert(duplicate.main_wing is container.main_wing)
+    duplicate.append(Data(tag = 'main_wing'))
+    container.append(Data(tag = 'main_wing'))
+    container.append(Data(tag = 'main_wing'))
+    assert('main_wing4' in duplicate and 'main_wing5' not in duplicate)
+    assert(list(container.keys())[-2:] == ['main_wing4','main_wing5'])
+    
+    # containers that override append still see every component
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+    aerodynamics = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    weights      = RCAIDE.Framework.Analyses.Weights.Weights_Transport()
+    analyses.extend([aerodynamics,weights])
+    assert(analyses.aerodynamics is aerodynamics)
+    assert(analyses.weights is weights)
+    assert('vortex_lattice_method' not in analyses)
+    assert('weights_transport' not in analyses)
+    
+    return 
+
+if __name__ == '__main__': 
+    main()    
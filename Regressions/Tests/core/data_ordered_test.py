@@ -0,0 +1,71 @@
+# data_ordered_test.py
+# 
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------  
+import RCAIDE
+from RCAIDE.Framework.Core import Data, DataOrdered, ContainerOrdered
+
+import numpy as np
+import pickle
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------  
+def main():
+    
+    data        = DataOrdered()
+    data.first  = 1.
+    data.second = Data(tag = 'second')
+    data.third  = np.array([1.,2.,3.])
+    
+    # items are members of the dict, attributes of the class are not
+    assert('first' in data)
+    assert('second' in data)
+    assert('append' not in data)
+    assert(list(data.keys()) == ['first','second','third'])
+    
+    # positive and negative integer indexing follows the insertion order
+    assert(data[0] == 1.)
+    assert(data[1] is data.second)
+    assert(data[-1] is data.third)
+    assert(data[-3] == 1.)
+    assert(data[np.int64(-2)] is data.second)
+    
+    # appending an existing tag replaces the value in place
+    segments = ContainerOrdered()
+    climb_1  = Data(tag = 'climb_1')
+    climb_2  = Data(tag = 'climb_2')
+    cruise   = Data(tag = 'cruise')
+    segments.append(climb_1)
+    segments.append(climb_2)
+    segments.append(cruise)
+    climb_2_new = Data(tag = 'climb_2')
+    segments.append(climb_2_new)
+    assert(list(segments.keys()) == ['climb_1','climb_2','cruise'])
+    assert(segments.climb_2 is climb_2_new)
+    
+    # pop removes an item and returns it
+    assert(segments.pop('climb_1') is climb_1)
+    assert('climb_1' not in segments)
+    assert(list(segments.keys()) == ['climb_2','cruise'])
+    
+    # a pickle round trip keeps the class, the order and the values
+    for original in [data,segments]:
+        restored = pickle.loads(pickle.dumps(original))
+        assert(type(restored) is type(original))
+        assert(list(restored.keys()) == list(original.keys()))
+    restored = pickle.loads(pickle.dumps(data))
+    assert(restored.first == 1.)
+    assert(restored.second.tag == 'second')
+    assert(np.array_equal(restored.third,data.third))
+    assert(restored.third is not data.third)
+    assert(restored[-1] is restored.third)
+    assert('first' in restored)
+    
+    return 
+
+if __name__ == '__main__': 
+    main()    
@@ -0,0 +1,217 @@
+# diffed_data_test.py
+# 
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------  
+import RCAIDE
+from RCAIDE.Framework.Core import Data, DataOrdered
+from RCAIDE.Framework.Core.Diffed_Data import _fast_clone, diff
+
+import numpy as np
+from copy import deepcopy
+import sys, os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Boeing_737 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------  
+def main():
+    
+    # a real vehicle, which carries DataOrdered branches, clones the same way deepcopy copies it
+    vehicle = vehicle_setup()
+    assert(isinstance(vehicle.performance,DataOrdered))
+    check_clone(vehicle,_fast_clone(vehicle),deepcopy(vehicle))
+    
+    # as does a DataOrdered on its own
+    ordered       = DataOrdered(first = 1., second = np.ones(3))
+    ordered.third = Data(tag = 'third', values = DataOrdered(a = np.zeros(2)))
+    check_clone(ordered,_fast_clone(ordered),deepcopy(ordered))
+    
+    # as does a config built on it
+    config = RCAIDE.Library.Components.Configs.Config(vehicle)
+    check_clone(config,_fast_clone(config),deepcopy(config))
+    
+    # shared references and cycles stay shared, arrays are copied with their layout
+    shared       = np.arange(12.).reshape(3,4)
+    tree         = Data()
+    tree.a       = shared
+    tree.b       = Data(c = shared, d = np.asfortranarray(shared), e = [shared,'text',(1,2)])
+    tree.ordered = DataOrdered()
+    tree.ordered.f = tree.b
+    tree.ordered.g = np.array([1,'two',None],dtype=object)
+    tree.cycle   = tree
+    clone        = _fast_clone(tree)
+    check_clone(tree,clone,deepcopy(tree))
+    assert(clone.a is clone.b.c)
+    assert(clone.a is clone.b.e[0])
+    assert(clone.a is not shared)
+    assert(clone.ordered.f is clone.b)
+    assert(clone.cycle is clone)
+    assert(clone.b.d.flags['F_CONTIGUOUS'])
+    
+    # classes that change how they are copied are handed to deepcopy
+    special          = Data()
+    special.custom   = Custom_Copy(value = 1.)
+    special.reduced  = Custom_Reduce(value = np.ones(3))
+    del copied[:]
+    clone            = _fast_clone(special)
+    assert(copied == ['custom','reduced'] or copied == ['reduced','custom'])
+    check_clone(special,clone,deepcopy(special))
+    
+    # the diff of every config matches a recursive walk and holds only the changed settings
+    configs = configs_setup(vehicle_setup())
+    for config in configs:
+        delta = diff(config,config._base)
+        assert(flatten(delta) == flatten(recursive_diff(config,config._base)))
+    delta = flatten(diff(configs.takeoff,configs.takeoff._base))
+    assert(sorted(delta.keys()) == ['V2_VS_ratio',
+                                    'networks.fuel.propulsors.port_propulsor.fan.angular_velocity',
+                                    'networks.fuel.propulsors.starboard_propulsor.fan.angular_velocity',
+                                    'tag',
+                                    'wings.main_wing.control_surfaces.flap.deflection',
+                                    'wings.main_wing.control_surfaces.slat.deflection'])
+    
+    # identical trees, including array subclasses, have no differences
+    tree   = Data(m = np.matrix([[1.,2.]]), k = np.ma.array([1.,2.],mask=[0,1]), v = np.ones(3), 
+                  o = DataOrdered(a = 1., b = 'text'))
+    assert(not diff(tree,tree))
+    assert(not diff(tree,deepcopy(tree)))
+    
+    # changed leaves and keys found on one side only are reported, unchanged branches are dropped
+    other     = deepcopy(tree)
+    other.m   = np.matrix([[1.,3.]])
+    other.o.a = 2.
+    other.new = 1.
+    delta     = diff(other,tree)
+    assert(sorted(delta.keys()) == ['m','new','o'])
+    assert(list(delta.o.keys()) == ['a'])
+    assert(delta.new == 1.)
+    assert(diff(tree,other).new is None)
+    
+    # nesting deeper than the recursion limit is walked
+    a = b = Data()
+    c = d = Data()
+    for i in range(sys.getrecursionlimit() + 100):
+        b.child = Data()
+        d.child = Data()
+        b, d    = b.child, d.child
+    b.value = 1.
+    d.value = 2.
+    delta   = diff(a,c)
+    depth   = 0
+    while 'child' in delta:
+        delta  = delta.child
+        depth += 1
+    assert(depth == sys.getrecursionlimit() + 100)
+    assert(delta.value == 1.)
+    
+    return 
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Classes that copy differently from Data
+# ----------------------------------------------------------------------------------------------------------------------   
+
+# names of the classes copied through their own hooks
+copied = []
+
+class Custom_Copy(Data):
+    def __deepcopy__(self,memo):
+        copied.append('custom')
+        return Custom_Copy(deepcopy(dict(self),memo))
+
+class Custom_Reduce(Data):
+    def __reduce__(self):
+        return (_rebuild_reduced,(self.__class__,dict(self)))
+
+def _rebuild_reduced(cls,items):
+    copied.append('reduced')
+    return cls(items)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Function
+# ----------------------------------------------------------------------------------------------------------------------  
+
+def check_clone(original,clone,reference):
+    """ Walks an original tree alongside its clone and a deepcopy of it, checking that the clone has the 
+        same types, keys and values as the deepcopy, and shares or copies the same objects
+    """
+    seen  = {}
+    stack = [(original,clone,reference)]
+    while stack:
+        o, c, r = stack.pop()
+        
+        # every reference to an object maps to one copy, in both copies
+        if id(o) in seen:
+            assert(seen[id(o)][0] is c)
+            assert(seen[id(o)][1] is r)
+            continue
+        seen[id(o)] = (c,r)
+        
+        assert(type(c) is type(r))
+        assert((c is o) == (r is o))
+        if c is o:
+            continue
+        
+        if isinstance(o,np.ndarray):
+            assert(c.dtype == r.dtype and c.shape == r.shape)
+            if o.dtype.hasobject:
+                stack.extend(zip(o.ravel(),c.ravel(),r.ravel()))
+            else:
+                assert(np.array_equal(c,r,equal_nan = o.dtype.kind in 'fc'))
+        elif isinstance(o,dict):
+            assert(list(dict.keys(c)) == list(dict.keys(r)) == list(dict.keys(o)))
+            stack.extend((dict.__getitem__(o,k),dict.__getitem__(c,k),dict.__getitem__(r,k)) for k in dict.keys(o))
+            if hasattr(o,'__dict__'):
+                stack.append((vars(o),vars(c),vars(r)))
+        elif isinstance(o,(list,tuple)):
+            assert(len(c) == len(r) == len(o))
+            stack.extend(zip(o,c,r))
+        elif hasattr(o,'__dict__') and not isinstance(o,type):
+            stack.append((vars(o),vars(c),vars(r)))
+        else:
+            assert(c == r)
+    
+    return 
+
+def recursive_diff(A,B):
+    """ Reference diff, the recursive walk diff() replaced """
+    result = type(A)()
+    result.clear()
+    keys   = set(A.keys()) | set(B.keys())
+    keys  -= set(['_base','_diff'])
+    for key in keys:
+        va = A.get(key,None)
+        vb = B.get(key,None)
+        if (isinstance(va,Data) and isinstance(vb,Data)) or (isinstance(va,DataOrdered) and isinstance(vb,DataOrdered)):
+            sub_diff = recursive_diff(va,vb)
+            if sub_diff:
+                result[key] = sub_diff
+        elif isinstance(va,(Data,DataOrdered)) or isinstance(vb,(Data,DataOrdered)):
+            result[key] = va
+        elif isinstance(va,np.ndarray) or isinstance(vb,np.ndarray):
+            if not np.array_equal(va,vb):
+                result[key] = va
+        else:
+            try:
+                if va != vb:
+                    result[key] = va
+            except ValueError:
+                result[key] = va
+    return result
+
+def flatten(tree,prefix=''):
+    """ Maps the dotted path of every leaf of a diff to its value """
+    leaves = {}
+    for key, value in dict.items(tree):
+        if isinstance(value,(Data,DataOrdered)):
+            leaves.update(flatten(value,prefix + key + '.'))
+        else:
+            leaves[prefix + key] = value
+    return leaves
+
+if __name__ == '__main__': 
+    main()    
@@ -0,0 +1,125 @@
+# utilities_test.py
+# 
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------  
+from RCAIDE.Framework.Core.Utilities import interp2d, Interp2D, angles_to_dcms, angles_to_dcms_soa
+
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------  
+def main():
+    
+    # a nonuniform grid of a smooth function
+    xp = np.array([0., 0.5, 1.5, 3., 5.])
+    yp = np.array([-1., 0., 2., 2.5])
+    zp = np.sin(xp)[:,None] * np.cos(yp)[None,:] + xp[:,None] * yp[None,:]
+    
+    # queries inside the grid, on its edges and outside it
+    x = np.array([0., 0.25, 1., 2.2, 4.9, 5., -1., 6., 2.])
+    y = np.array([-1., 0.5, 2.2, 1., 2.5, 0., 0., 1., 3.])
+    
+    # the interpolant matches the free function, clamped and filled
+    z_truth  = interp2d(x,y,xp,yp,zp)
+    z_interp = Interp2D(xp,yp,zp)(x,y)
+    assert(np.allclose(z_interp,z_truth,rtol=1e-12,atol=1e-12))
+    
+    z_truth  = interp2d(x,y,xp,yp,zp,fill_value=np.nan)
+    z_interp = Interp2D(xp,yp,zp,fill_value=np.nan)(x,y)
+    assert(np.array_equal(np.isnan(z_interp),np.isnan(z_truth)))
+    assert(np.all(np.isnan(z_truth[6:])))
+    assert(np.allclose(z_interp[:6],z_truth[:6],rtol=1e-12,atol=1e-12))
+    
+    # grid points are reproduced exactly
+    X, Y = np.meshgrid(xp,yp,indexing='ij')
+    assert(np.allclose(Interp2D(xp,yp,zp)(X,Y),zp,rtol=1e-12,atol=1e-12))
+    
+    # a batch of query sets of shape (B, N) is evaluated in one pass
+    x_b = np.stack([x,x[::-1],x*0.5])
+    y_b = np.stack([y,y[::-1],y*0.5])
+    z_b = Interp2D(xp,yp,zp,fill_value=0.)(x_b,y_b)
+    assert(z_b.shape == x_b.shape)
+    for i in range(len(x_b)):
+        assert(np.allclose(z_b[i],interp2d(x_b[i],y_b[i],xp,yp,zp,fill_value=0.),rtol=1e-12,atol=1e-12))
+    
+    # integer queries and grids are interpolated in floating point
+    xp_i = np.arange(4)
+    yp_i = np.arange(3)
+    zp_i = np.arange(12).reshape(4,3)
+    x_i  = np.array([1,2])
+    y_i  = np.array([0,1])
+    assert(np.allclose(interp2d(x_i,y_i,xp_i,yp_i,np.ones((4,3))),[1.,1.]))
+    assert(np.allclose(interp2d(x_i,y_i,xp_i,yp_i,zp_i),[3.,7.]))
+    assert(np.allclose(Interp2D(xp_i,yp_i,zp_i)(x_i,y_i),[3.,7.]))
+    
+    # nested lists are accepted as the grid, tables of any other rank are rejected
+    interp = Interp2D(xp_i.tolist(),yp_i.tolist(),zp_i.tolist())
+    assert(np.allclose(interp(x_i,y_i),[3.,7.]))
+    for zp_bad in [np.arange(4.),np.ones((4,3,2))]:
+        try:
+            Interp2D(xp_i,yp_i,zp_bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('Interp2D accepted a table that is not 2D')
+    
+    # both layouts of the direction cosine matrices match the product of the rotations about each axis
+    n         = 7
+    rotations = np.linspace(-np.pi,np.pi,3*n).reshape(3,n).T
+    for sequence in [(2,1,0),(2,1,2)]:
+        truth   = reference_dcms(rotations,sequence)
+        dcms    = angles_to_dcms(rotations,sequence)
+        entries = angles_to_dcms_soa(rotations,sequence)
+        assert(dcms.shape == (n,3,3))
+        assert(entries.shape == (9,n))
+        assert(np.allclose(dcms,truth,rtol=1e-12,atol=1e-12))
+        assert(np.allclose(entries,truth.reshape(n,9).T,rtol=1e-12,atol=1e-12))
+    
+    # complex-step rotations go through the closed form in complex arithmetic
+    h              = 1e-30
+    step           = np.zeros_like(rotations)
+    step[:,1]      = h
+    rotations_cs   = rotations + 1j*step
+    truth          = reference_dcms(rotations_cs,(2,1,0))
+    dcms           = angles_to_dcms(rotations_cs)
+    entries        = angles_to_dcms_soa(rotations_cs)
+    assert(dcms.dtype == np.complex128 and entries.dtype == np.complex128)
+    assert(np.allclose(dcms,truth,rtol=1e-12,atol=1e-12))
+    assert(np.allclose(dcms.imag/h,truth.imag/h,rtol=1e-10,atol=1e-10))
+    assert(np.allclose(entries,truth.reshape(n,9).T,rtol=1e-12,atol=1e-12))
+    
+    # the complex step gives the derivative with respect to the second angle
+    d_dcms = (angles_to_dcms(rotations + 1e-6*step/h) - angles_to_dcms(rotations - 1e-6*step/h))/2e-6
+    assert(np.allclose(dcms.imag/h,d_dcms,rtol=1e-6,atol=1e-8))
+    
+    return 
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helper Function
+# ----------------------------------------------------------------------------------------------------------------------  
+
+def reference_dcms(rotations,sequence):
+    """ Direction cosine matrices built as the product of the rotations about each axis, T(r_s2) T(r_s1) T(r_s0) """
+    n      = len(rotations)
+    zero   = np.zeros(n)
+    one    = np.ones(n)
+    result = np.broadcast_to(np.eye(3),(n,3,3)).astype(rotations.dtype)
+    for dim in sequence[::-1]:
+        c = np.cos(rotations[:,dim])
+        s = np.sin(rotations[:,dim])
+        if dim == 0:
+            T = [[one,zero,zero],[zero,c,s],[zero,-s,c]]
+        elif dim == 1:
+            T = [[c,zero,-s],[zero,one,zero],[s,zero,c]]
+        else:
+            T = [[c,s,zero],[-s,c,zero],[zero,zero,one]]
+        T      = np.moveaxis(np.array(T),-1,0)
+        result = np.einsum('aij,ajk->aik',result,T)
+    return result
+
+if __name__ == '__main__': 
+    main()    
@@ -16,6 +16,10 @@ modules = [
     'Tests/analysis_aerodynamics/VLM_control_surface_test.py',    
     'Tests/analysis_aerodynamics/VLM_moving_surface_test.py',   
     'Tests/analysis_aerodynamics/AVL_test.py',     
+    'Tests/core/container_test.py',
+    'Tests/core/data_ordered_test.py',
+    'Tests/core/diffed_data_test.py',
+    'Tests/core/utilities_test.py',
     'Tests/atmosphere/atmosphere.py',
     'Tests/atmosphere/constant_temperature.py',
     'Tests/analysis_emissions/emissions_test.py',   